@@ -2,6 +2,8 @@
 
 import os
 import csv
+import itertools
+import re
 from datetime import datetime
 from src.scrapers.reviewjournal.scraper import ReviewJournalScraper
 from src.utils.logger import get_logger
@@ -9,8 +11,47 @@ from src.utils.logger import get_logger
 # Configure logging
 logger = get_logger('reviewjournal_test')
 
+# Jewelry or luxury store keywords, matched anywhere in the title or excerpt
+JEWELRY_PATTERN = re.compile(
+    r'jewelry|jeweler|jewellery|diamond|gold|silver|watch|rolex|luxury|high-end|boutique',
+    re.IGNORECASE
+)
+
+CSV_FIELDNAMES = [
+    'location', 'title', 'date', 'url', 'excerpt',
+    'source', 'keywords', 'is_theft_related', 'is_business_related',
+    'detailed_location'
+]
+
+def jewelry_theft_rows(results):
+    """Yield a CSV row for each jewelry or luxury store theft in the scraper results."""
+    for location, articles in results.items():
+        for article in articles:
+            # Only keep articles that are theft-related, business-related, and
+            # jewelry-related; the keyword scan runs only when the flags pass
+            if not (article['is_theft_related'] and article['is_business_related'] and
+                    JEWELRY_PATTERN.search(article['title'] + ' ' + article['excerpt'])):
+                continue
+            
+            yield {
+                'location': 'Nevada',  # Review Journal is Nevada-focused
+                'title': article['title'],
+                'date': article['date'],
+                'url': article['url'],
+                'excerpt': article['excerpt'],
+                'source': article['source'],
+                'keywords': ','.join(article['keywords']),
+                'is_theft_related': article['is_theft_related'],
+                'is_business_related': article['is_business_related'],
+                'detailed_location': article.get('detailed_location', 'Las Vegas area')
+            }
+
 def run_reviewjournal_scraper():
-    """Run the Review Journal scraper and filter for jewelry and luxury store thefts."""
+    """
+    Run the Review Journal scraper and filter for jewelry and luxury store thefts.
+    
+    Returns the number of matching articles written to the output CSV.
+    """
     
     logger.info("Starting Review Journal scraper test")
     
@@ -20,6 +61,14 @@ def run_reviewjournal_scraper():
     # Run the scraper
     results = scraper.scrape()
     
+    # Rows are written as they pass the filter, in a single pass; the file is
+    # only created once the first matching row exists
+    rows = jewelry_theft_rows(results)
+    first_row = next(rows, None)
+    if first_row is None:
+        print("No jewelry or luxury theft articles found")
+        return 0
+    
     # Create output directory if it doesn't exist
     os.makedirs('output', exist_ok=True)
     
@@ -27,64 +76,20 @@ def run_reviewjournal_scraper():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_file = f'output/reviewjournal_jewelry_theft_{timestamp}.csv'
     
-    # Post-process results to further filter for jewelry and luxury store thefts
-    jewelry_theft_articles = []
+    print("\nFound articles:")
+    count = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        for row in itertools.chain((first_row,), rows):
+            writer.writerow(row)
+            count += 1
+            print(f"{count}. {row['title']} ({row['date']})")
     
-    for location, articles in results.items():
-        for article in articles:
-            # Check for jewelry or luxury store keywords
-            title_and_excerpt = (article['title'] + ' ' + article['excerpt']).lower()
-            
-            # Look for jewelry or luxury store related keywords
-            jewelry_keywords = ['jewelry', 'jeweler', 'jewellery', 'diamond', 'gold', 'silver', 
-                               'watch', 'rolex', 'luxury', 'high-end', 'boutique']
-            
-            # Check if any jewelry keywords are in the title or excerpt
-            is_jewelry_related = any(keyword in title_and_excerpt for keyword in jewelry_keywords)
-            
-            # Only keep articles that are theft-related, business-related, and jewelry-related
-            if article['is_theft_related'] and article['is_business_related'] and is_jewelry_related:
-                jewelry_theft_articles.append(article)
+    print(f"Results saved to {output_file}")
+    print(f"Found {count} jewelry/luxury theft articles")
     
-    # Write filtered results to CSV
-    if jewelry_theft_articles:
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'location', 'title', 'date', 'url', 'excerpt',
-                'source', 'keywords', 'is_theft_related', 'is_business_related',
-                'detailed_location'
-            ])
-            writer.writeheader()
-            
-            for article in jewelry_theft_articles:
-                row = {
-                    'location': 'Nevada',  # Review Journal is Nevada-focused
-                    'title': article['title'],
-                    'date': article['date'],
-                    'url': article['url'],
-                    'excerpt': article['excerpt'],
-                    'source': article['source'],
-                    'keywords': ','.join(article['keywords']),
-                    'is_theft_related': article['is_theft_related'],
-                    'is_business_related': article['is_business_related'],
-                    'detailed_location': article.get('detailed_location', 'Las Vegas area')
-                }
-                writer.writerow(row)
-        
-        print(f"Results saved to {output_file}")
-        print(f"Found {len(jewelry_theft_articles)} jewelry/luxury theft articles")
-    else:
-        print("No jewelry or luxury theft articles found")
-    
-    return jewelry_theft_articles
+    return count
 
 if __name__ == "__main__":
-    articles = run_reviewjournal_scraper()
-    
-    # Display article titles
-    if articles:
-        print("\nFound articles:")
-        for i, article in enumerate(articles, 1):
-            print(f"{i}. {article['title']} ({article['date']})")
-    else:
-        print("No relevant articles found")
\ No newline at end of file
+    run_reviewjournal_scraper()
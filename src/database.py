@@ -48,6 +48,14 @@ load_dotenv()
 # Define database file path from environment variable or use default
 DATABASE_FILE = os.getenv('DATABASE_PATH', os.path.join(os.path.dirname(os.path.dirname(__file__)), 'crime_data.db'))
 
+# Applied to every new connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536"  # 64 MB page cache
+)
+
 def get_db_connection() -> Optional[sqlite3.Connection]:
     """
     Establishes and returns a connection to the SQLite database.
@@ -58,6 +66,15 @@ def get_db_connection() -> Optional[sqlite3.Connection]:
     try:
         conn = sqlite3.connect(DATABASE_FILE)
         conn.row_factory = sqlite3.Row  # Return rows as dictionary-like objects
+
+        # WAL with synchronous=NORMAL syncs once per checkpoint instead of on every
+        # commit, and keeps readers from blocking the scraper's writes
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error as e:
+                # Tuning only; the connection still works with SQLite's defaults
+                logger.warning(f"Could not apply '{pragma}': {str(e)}")
         return conn
     except sqlite3.Error as e:
         logger.error(f"Database connection error: {str(e)}")
@@ -189,7 +206,7 @@ def _create_articles_table(conn: sqlite3.Connection) -> bool:
             location TEXT,
             title TEXT,
             article_date TEXT, -- Store as ISO format YYYY-MM-DD
-            url TEXT UNIQUE NOT NULL, -- Ensure unique articles based on URL
+            url TEXT UNIQUE NOT NULL, -- Ensure unique articles based on URL; its index also serves duplicate checks
             excerpt TEXT,
             source TEXT,
             keywords TEXT,
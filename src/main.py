@@ -180,7 +180,8 @@ def run_scraper() -> Optional[str]:
     """
     try:
         logger.info("Starting the unified scraper...")
-        scraper = UnifiedScraper()
+        # The analyzer step reads the scraper's CSV output
+        scraper = UnifiedScraper(write_csv=True)
         results = scraper.scrape_all(deep_check=False)
 
         # Find the most recent CSV file in the output directory
@@ -0,0 +1,287 @@
+"""
+Text filtering functions shared by the scraper utility modules.
+
+Each scraper classifies articles the same way - location detection, theft keyword
+extraction, business relevance filtering and date standardization - against its
+own configuration. This module builds the matchers once per configuration:
+- Keyword scanners that match whole words without a regex search per keyword
+- Text analyzers combining the theft and business keyword scans behind one
+  relevance pattern
+- Location detectors that find every location mention in a single pass
+- Cached date parsing over a list of strptime formats
+
+Scrapers configured with the same keywords or locations share the same matcher.
+"""
+
+import re
+import sys
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Today's date used as the fallback for missing or unparseable dates; it is
+# recomputed at most once per refresh interval instead of once per article
+_TODAY_REFRESH_SECONDS = 60
+_today_cache = {"checked_at": 0.0, "value": ""}
+
+def today() -> str:
+    """Return today's date in YYYY-MM-DD format, cached for a short interval."""
+    now = time.monotonic()
+    if not _today_cache["value"] or now - _today_cache["checked_at"] > _TODAY_REFRESH_SECONDS:
+        _today_cache["checked_at"] = now
+        _today_cache["value"] = datetime.now().strftime('%Y-%m-%d')
+    return _today_cache["value"]
+
+def _is_word_char(char: str) -> bool:
+    """Match the characters the regex word boundary treats as part of a word."""
+    return char.isalnum() or char == '_'
+
+def contains_word(content: str, keyword: str) -> bool:
+    """
+    Check whether keyword occurs in content as a whole word.
+    
+    Equivalent to re.search(r'\\b' + re.escape(keyword) + r'\\b', content) for
+    keywords that start and end with a word character, but uses str.find so no
+    regex is compiled or cached per keyword.
+    
+    Parameters:
+    -----------
+    content : str
+        Content to search
+    keyword : str
+        Keyword to look for
+    
+    Returns:
+    --------
+    bool
+        True if keyword occurs with a word boundary on both sides
+    """
+    keyword_length = len(keyword)
+    index = content.find(keyword)
+    while index != -1:
+        end = index + keyword_length
+        if ((index == 0 or not _is_word_char(content[index - 1])) and
+                (end == len(content) or not _is_word_char(content[end]))):
+            return True
+        index = content.find(keyword, index + 1)
+    return False
+
+def keyword_pattern(keywords: Iterable[str]) -> 're.Pattern':
+    """
+    Compile keywords into one whole-word alternation pattern.
+    
+    Keywords are lowercased and tried longest first, so the pattern is meant to
+    run over lowercased content.
+    
+    Parameters:
+    -----------
+    keywords : Iterable[str]
+        Keywords to combine
+    
+    Returns:
+    --------
+    re.Pattern
+        Compiled pattern matching any of the keywords
+    """
+    return re.compile(
+        r'\b(?:' + '|'.join(re.escape(k.lower()) for k in sorted(keywords, key=len, reverse=True)) + r')\b'
+    )
+
+def make_keyword_extractor(keywords: Sequence[str]) -> Callable[..., List[str]]:
+    """
+    Build a function returning the keywords found in a piece of content.
+    
+    Parameters:
+    -----------
+    keywords : Sequence[str]
+        Keywords to look for, in the order they should be reported
+    
+    Returns:
+    --------
+    Callable[..., List[str]]
+        Function taking content (and already_lower) and returning the found keywords
+    """
+    # Lowercased, interned and deduplicated once, keeping configuration order,
+    # so extracted keyword lists never repeat an entry and share one string
+    # object per keyword across all articles
+    return _keyword_extractor(tuple(dict.fromkeys(sys.intern(k.lower()) for k in keywords)))
+
+@lru_cache(maxsize=None)
+def _keyword_extractor(keywords: Tuple[str, ...]) -> Callable[..., List[str]]:
+    """Build one extractor per distinct keyword list."""
+    def extract(content: str, already_lower: bool = False) -> List[str]:
+        if not already_lower:
+            content = content.lower()
+        return [keyword for keyword in keywords if contains_word(content, keyword)]
+    return extract
+
+def make_keyword_matcher(keywords: Sequence[str]) -> Callable[..., bool]:
+    """
+    Build a function reporting whether content contains any of the keywords.
+    
+    Parameters:
+    -----------
+    keywords : Sequence[str]
+        Keywords to look for
+    
+    Returns:
+    --------
+    Callable[..., bool]
+        Function taking content (and already_lower) that stops at the first match
+    """
+    return _keyword_matcher(tuple(dict.fromkeys(k.lower() for k in keywords)))
+
+@lru_cache(maxsize=None)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Callable[..., bool]:
+    """Build one matcher per distinct keyword list."""
+    def matches(content: str, already_lower: bool = False) -> bool:
+        if not already_lower:
+            content = content.lower()
+        return any(contains_word(content, keyword) for keyword in keywords)
+    return matches
+
+def make_text_analyzer(theft_keywords: Sequence[str],
+                       business_keywords: Sequence[str]) -> Callable[..., Tuple[List[str], bool]]:
+    """
+    Build a function extracting theft keywords and checking business relevance.
+    
+    Every theft and business keyword is also compiled into one pattern: content
+    it does not match can have neither, so the per-keyword scans are skipped.
+    
+    Parameters:
+    -----------
+    theft_keywords : Sequence[str]
+        Theft keywords to extract, in the order they should be reported
+    business_keywords : Sequence[str]
+        Keywords marking content as business related
+    
+    Returns:
+    --------
+    Callable[..., Tuple[List[str], bool]]
+        Function taking content (and already_lower) and returning the found theft
+        keywords and whether the content is business related
+    """
+    return _text_analyzer(tuple(theft_keywords), tuple(business_keywords))
+
+@lru_cache(maxsize=None)
+def _text_analyzer(theft_keywords: Tuple[str, ...],
+                   business_keywords: Tuple[str, ...]) -> Callable[..., Tuple[List[str], bool]]:
+    """Build one analyzer per distinct pair of keyword lists."""
+    relevance_pattern = keyword_pattern(theft_keywords + business_keywords)
+    extract_keywords = make_keyword_extractor(theft_keywords)
+    is_business_related = make_keyword_matcher(business_keywords)
+    
+    def analyze(content: str, already_lower: bool = False) -> Tuple[List[str], bool]:
+        if not already_lower:
+            content = content.lower()
+        if not relevance_pattern.search(content):
+            return [], False
+        return (extract_keywords(content, already_lower=True),
+                is_business_related(content, already_lower=True))
+    
+    return analyze
+
+def make_location_detector(location_variations: Dict[str, List[str]],
+                           preferred: Optional[str] = None,
+                           default: Optional[str] = None) -> Callable[..., Optional[str]]:
+    """
+    Build a function detecting which configured location content refers to.
+    
+    The returned detector scans the content once for every location variation.
+    When several locations are mentioned, the preferred location wins, then the
+    location listed first in location_variations.
+    
+    Parameters:
+    -----------
+    location_variations : Dict[str, List[str]]
+        Location names mapped to the names, abbreviations and cities that refer to them
+    preferred : Optional[str]
+        Location that takes precedence over all others when mentioned
+    default : Optional[str]
+        Location returned when no variation is found
+    
+    Returns:
+    --------
+    Callable[..., Optional[str]]
+        Function taking content (and already_lower) and returning the detected location
+    """
+    frozen = tuple((location, tuple(variations)) for location, variations in location_variations.items())
+    return _location_detector(frozen, preferred, default)
+
+@lru_cache(maxsize=None)
+def _location_detector(location_variations: Tuple[Tuple[str, Tuple[str, ...]], ...],
+                       preferred: Optional[str],
+                       default: Optional[str]) -> Callable[..., Optional[str]]:
+    """Build one detector per distinct configuration."""
+    priority = {location: index for index, (location, _) in enumerate(location_variations)}
+    if preferred is not None:
+        priority[preferred] = -1
+    best_priority = min(priority.values(), default=0)
+    
+    # Invert the configuration into a variation -> location lookup so a single
+    # combined pattern plus one dict lookup per match replaces a regex search
+    # per variation. The scan only reports the longest variation at each spot,
+    # so a variation maps to the highest-priority location among every variation
+    # it contains (e.g. "kansas city" also mentions "kansas"). Location names
+    # are interned since every detected location is one of them
+    pairs = [
+        (variation.lower(), sys.intern(location))
+        for location, variations in location_variations
+        for variation in variations
+    ]
+    locations = {
+        variation: min(
+            (location for other, location in pairs if contains_word(variation, other)),
+            key=priority.__getitem__
+        )
+        for variation, _ in pairs
+    }
+    pattern = keyword_pattern(locations)
+    
+    def detect(content: str, already_lower: bool = False) -> Optional[str]:
+        if not already_lower:
+            content = content.lower()
+        
+        # One pass finds every location mention; the highest-priority location
+        # among them wins, matching a per-location lookup in priority order
+        best_location = None
+        for match in pattern.finditer(content):
+            location = locations[match.group()]
+            if best_location is None or priority[location] < priority[best_location]:
+                best_location = location
+                if priority[best_location] == best_priority:
+                    break
+        
+        return default if best_location is None else best_location
+    
+    return detect
+
+@lru_cache(maxsize=2048)
+def parse_date(date_str: str, formats: Tuple[str, ...]) -> Optional[str]:
+    """
+    Parse a date string against a list of strptime formats.
+    
+    Articles published around the same time repeat the same date string, so
+    results are memoized.
+    
+    Parameters:
+    -----------
+    date_str : str
+        Date string to parse
+    formats : Tuple[str, ...]
+        strptime formats to try, in order
+    
+    Returns:
+    --------
+    Optional[str]
+        Date in YYYY-MM-DD format, or None when no format matches
+    """
+    date_str = date_str.strip()
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    
+    return None
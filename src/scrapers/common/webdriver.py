@@ -0,0 +1,245 @@
+"""
+WebDriver and HTTP setup shared by the Selenium-based scrapers.
+
+This module holds the browser and connection state every scraper shares within
+a process:
+- The chromedriver path, resolved once under a lock, since webdriver_manager
+  keeps its drivers.json and the unpacked driver in one cache directory and is
+  not safe to run from several threads at once
+- One temp directory holding every driver's Chrome profile
+- DriverPool, which keeps idle drivers alive for reuse by later scrapes
+- PooledDriverMixin, the driver acquire/release and scrolling used by scrapers
+  that take their drivers from a DriverPool
+- http_session, one requests session whose connection pool is reused by every
+  plain HTTP fetch
+"""
+
+import atexit
+import logging
+import os
+import queue
+import tempfile
+import threading
+import uuid
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+# Shared session so repeated fetches and retries reuse TCP/TLS connections
+http_session = requests.Session()
+http_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+})
+http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+atexit.register(http_session.close)
+
+_driver_path_lock = threading.Lock()
+_driver_path: Optional[str] = None
+
+_user_data_lock = threading.Lock()
+_user_data_root: Optional[str] = None
+
+def chromedriver_path() -> str:
+    """
+    Return the path of the chromedriver binary, installing it on first use.
+    
+    Concurrent callers wait for the first install instead of starting their own,
+    and later calls skip webdriver_manager's network version check.
+    
+    Returns:
+    --------
+    str
+        Path to the chromedriver binary
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def chrome_user_data_dir() -> str:
+    """
+    Return a new, unique Chrome profile directory path.
+    
+    Every profile lives under one temp directory created on first use, instead
+    of one temp directory per driver.
+    
+    Returns:
+    --------
+    str
+        Path of a profile directory no other driver uses
+    """
+    global _user_data_root
+    with _user_data_lock:
+        if _user_data_root is None:
+            _user_data_root = tempfile.mkdtemp(prefix="chromium_data_")
+    return os.path.join(_user_data_root, str(uuid.uuid4()))
+
+class DriverPool:
+    """
+    Idle WebDrivers kept alive for reuse by later scrapes in the same process.
+    
+    Drivers are handed out last in, first out, so the most recently used
+    browser is reused first. A driver that hit a navigation or script error is
+    quit instead of being pooled, and every idle driver is quit when the
+    process exits.
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        Parameters:
+        -----------
+        maxsize : int
+            Most idle drivers kept; drivers released to a full pool are quit
+        """
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+        atexit.register(self.shutdown)
+    
+    def acquire(self) -> Optional[Any]:
+        """
+        Take the most recently released idle driver.
+        
+        Returns:
+        --------
+        Optional[Any]
+            An idle driver, or None if the caller has to set up a new one
+        """
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            return None
+        logger.info("Reusing pooled WebDriver")
+        return driver
+    
+    def release(self, driver: Optional[Any], dirty: bool = False) -> None:
+        """
+        Return a driver to the pool, quitting it if it is dirty or the pool is full.
+        
+        Parameters:
+        -----------
+        driver : Optional[Any]
+            Driver to release; None is ignored
+        dirty : bool
+            Whether the driver hit a navigation or script error
+        """
+        if driver is None:
+            return
+        
+        if dirty:
+            logger.info("Quitting WebDriver after a navigation error instead of pooling it")
+            self._quit(driver)
+            return
+        
+        try:
+            # Drop session state so the next scrape starts clean
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except queue.Full:
+            self._quit(driver)
+        except Exception as e:
+            logger.warning(f"Discarding WebDriver that failed to reset: {str(e)}")
+            self._quit(driver)
+    
+    def shutdown(self) -> None:
+        """Quit every idle driver in the pool"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(driver)
+    
+    def empty(self) -> bool:
+        """Whether the pool holds no idle driver"""
+        return self._idle.empty()
+    
+    @staticmethod
+    def _quit(driver: Any) -> None:
+        """Quit a driver, ignoring errors from a browser that is already gone"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+class PooledDriverMixin:
+    """
+    Driver handling for scrapers that take their WebDrivers from a DriverPool.
+    
+    Subclasses set the _driver_pool class attribute and implement setup_driver(),
+    which assigns a new driver to self.driver. A driver that hit a navigation or
+    script error is marked dirty and quit on release instead of being pooled.
+    """
+    
+    _driver_pool: DriverPool
+    driver: Optional[Any] = None
+    _driver_dirty: bool = False
+    
+    def _acquire_driver(self) -> Optional[Any]:
+        """Take an idle driver from the pool, or set up a new one if none is available"""
+        driver = self._driver_pool.acquire()
+        if driver is not None:
+            self.driver = driver
+        else:
+            self.setup_driver()
+        self._driver_dirty = False
+        return self.driver
+    
+    def _release_driver(self) -> None:
+        """Return the current driver to the pool, quitting it if it is dirty or the pool is full"""
+        driver, self.driver = self.driver, None
+        self._driver_pool.release(driver, dirty=self._driver_dirty)
+    
+    @classmethod
+    def shutdown_drivers(cls) -> None:
+        """Quit every idle driver in the pool"""
+        cls._driver_pool.shutdown()
+    
+    def scroll_to_load_more(self, max_scrolls: int = 10) -> None:
+        """
+        Scroll down the page to load more dynamically loaded content
+        
+        Each scroll waits only as long as it takes for new content to grow the
+        page, up to 3 seconds, and scrolling stops at the first scroll that
+        loads nothing.
+        
+        Parameters:
+        -----------
+        max_scrolls : int
+            Maximum number of scroll operations to perform
+        """
+        try:
+            if not self.driver:
+                logger.warning("No driver available for scrolling")
+                return
+                
+            logger.info(f"Starting scroll operation to load more content (max: {max_scrolls})")
+            initial_height = self.driver.execute_script("return document.body.scrollHeight")
+            
+            for i in range(max_scrolls):
+                # Scroll to bottom
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                
+                try:
+                    WebDriverWait(self.driver, 3, poll_frequency=0.1).until(
+                        lambda driver: driver.execute_script("return document.body.scrollHeight") > initial_height
+                    )
+                except TimeoutException:
+                    # No new content loaded, stop scrolling
+                    logger.info(f"No new content after scroll {i+1}, stopping")
+                    break
+                    
+                initial_height = self.driver.execute_script("return document.body.scrollHeight")
+                logger.info(f"Completed scroll {i+1}/{max_scrolls}, new height: {initial_height}")
+                
+        except Exception as e:
+            logger.error(f"Error during scroll operation: {str(e)}")
+            self._driver_dirty = True
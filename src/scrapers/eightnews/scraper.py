@@ -14,13 +14,13 @@ from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from ..base import BaseScraper, Article
+from ..common.webdriver import chromedriver_path
 from .config import EIGHTNEWS_CONFIG, MONITORED_LOCATIONS
 from .utils import detect_location, extract_keywords, is_business_related, standardize_date, extract_location_details
 from src.utils.logger import get_logger
@@ -77,7 +77,7 @@ class EightNewsScraper(BaseScraper):
                     
                     # Fall back to webdriver_manager approach
                     logger.info("Falling back to webdriver_manager")
-                    service = Service(ChromeDriverManager().install())
+                    service = Service(chromedriver_path())
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                     self.driver.set_page_load_timeout(30)
                     return self.driver
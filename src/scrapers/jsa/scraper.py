@@ -33,7 +33,6 @@ from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -45,6 +44,7 @@ Local application imports
 
 # Import from base package
 from ..base import BaseScraper, Article
+from ..common.webdriver import chromedriver_path
 from .config import JSA_CONFIG, MONITORED_LOCATIONS
 from .utils import detect_location, extract_keywords, is_business_related, standardize_date
 from ...utils.logger import get_logger
@@ -166,7 +166,7 @@ class JSAScraper(BaseScraper):
         """
         try:
             logger.info("Falling back to webdriver_manager")
-            service = Service(ChromeDriverManager().install())
+            service = Service(chromedriver_path())
             return webdriver.Chrome(service=service, options=chrome_options)
 
         except Exception as e:
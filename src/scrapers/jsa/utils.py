@@ -12,10 +12,18 @@ import logging
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
+from ..common.text_filters import make_keyword_extractor, make_location_detector
 from .config import LOCATION_VARIATIONS, THEFT_KEYWORDS, BUSINESS_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
+# Inverts LOCATION_VARIATIONS into a variation -> state lookup once at import,
+# so detection is one scan plus a dict lookup per match
+_detect_location = make_location_detector(LOCATION_VARIATIONS)
+
+# Theft keywords are compiled once at import instead of a regex search per keyword
+_extract_keywords = make_keyword_extractor(THEFT_KEYWORDS)
+
 def detect_location(content: str) -> Optional[str]:
     """
     Detect location from content using location variations to identify sales territories.
@@ -39,21 +47,7 @@ def detect_location(content: str) -> Optional[str]:
     - Enables territory-specific follow-up strategies
     - Supports regional sales performance tracking
     """
-    content = content.lower()
-    
-    # First try to find state matches
-    for location, variations in LOCATION_VARIATIONS.items():
-        # Check state name and abbreviation first
-        state_variations = [variations[0], variations[1]]  # State name and abbreviation
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in state_variations):
-            return location
-            
-        # Then check cities
-        city_variations = variations[2:]  # All other variations are cities
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in city_variations):
-            return location
-                
-    return None
+    return _detect_location(content)
 
 def extract_keywords(content: str) -> List[str]:
     """
@@ -80,15 +74,7 @@ def extract_keywords(content: str) -> List[str]:
     - Matches specific security products to incident patterns
     - Provides conversation starters for sales outreach
     """
-    content = content.lower()
-    keywords = []
-    
-    # Check theft keywords
-    for keyword in THEFT_KEYWORDS:
-        if re.search(r'\b' + re.escape(keyword) + r'\b', content):
-            keywords.append(keyword)
-            
-    return keywords
+    return _extract_keywords(content)
 
 def is_business_related(content: str) -> bool:
     """
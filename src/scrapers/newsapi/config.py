@@ -15,6 +15,9 @@ NEWSAPI_CONFIG = {
         "sortBy": "publishedAt",
         "pageSize": 100
     },
+    # Searches run concurrently but share one rate limit
+    "max_concurrent_searches": 4,
+    "min_request_interval": 1.0,
     "search_terms": [
         # Location-specific searches
         "Nevada jewelry store theft",
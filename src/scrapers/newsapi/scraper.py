@@ -7,20 +7,92 @@ incidents and related information across multiple news sources.
 
 import time
 import os
+import re
+import sys
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
 
 from ..base import BaseScraper, Article
 from .config import NEWSAPI_CONFIG, MONITORED_LOCATIONS
-from .utils import detect_location, extract_keywords, is_business_related, standardize_date
+from .utils import (
+    business_related_flags, detect_location, extract_keywords, is_business_related, standardize_date
+)
 from src.utils.logger import get_logger
 from src.utils.exceptions import ScraperNetworkError, ScraperParsingError
 
+# orjson decodes the article arrays considerably faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Keywords for different store types
+STORE_TYPE_KEYWORDS = {
+    "Jewelry Store": ["jewelry store", "jeweler", "jewellers", "jewelers", "jewelry shop"],
+    "Watch Store": ["watch store", "watch shop", "rolex dealer"],
+    "Sports Memorabilia": ["sports memorabilia", "sports collectibles", "sports cards", "sports merchandise"],
+    "Luxury Retail": ["luxury store", "luxury boutique", "high-end retail", "luxury goods"]
+}
+
+# Terms that still indicate a jewelry store when no specific store type matches
+JEWELRY_FALLBACK_TERMS = ["jewelry", "jewellery", "diamond", "gold", "necklace", "bracelet"]
+
+# One named group per store type, in priority order, with the jewelry fallback
+# last, so a single scan finds every store type mentioned in the content
+_STORE_TYPE_LABELS = list(STORE_TYPE_KEYWORDS) + ["Jewelry Store"]
+_STORE_TYPE_PATTERN = re.compile('|'.join(
+    f'(?P<store_type_{index}>' + '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + ')'
+    for index, keywords in enumerate(list(STORE_TYPE_KEYWORDS.values()) + [JEWELRY_FALLBACK_TERMS])
+))
+
+def _detect_store_type_lower(content: str) -> str:
+    """Store type detection over already-lowercased content."""
+    # The highest-priority store type found anywhere in the content wins
+    best_index = None
+    for match in _STORE_TYPE_PATTERN.finditer(content):
+        index = int(match.lastgroup.rsplit('_', 1)[1])
+        if best_index is None or index < best_index:
+            best_index = index
+            if best_index == 0:
+                break
+                
+    if best_index is None:
+        return "High-Value Retail"
+        
+    return _STORE_TYPE_LABELS[best_index]
+
+def _decode_json(response) -> Dict:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least min_interval seconds apart"""
+    
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+    
+    def wait(self) -> None:
+        """Block until the caller is allowed to make its next request"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.min_interval
+        
+        if delay > 0:
+            time.sleep(delay)
+
 class NewsAPIScraper(BaseScraper):
     """NewsAPI-based scraper implementation"""
     
@@ -30,6 +102,13 @@ class NewsAPIScraper(BaseScraper):
         self.monitored_locations = MONITORED_LOCATIONS
         self.api_key = self.config["api_key"]
         self.session = requests.Session()
+        
+        # Keep a keep-alive connection per concurrent search
+        pool_size = self.config["max_concurrent_searches"]
+        self.session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+        
+        # Space out requests across worker threads to be nice to the API
+        self.rate_limiter = RateLimiter(self.config["min_request_interval"])
     
     def search_articles(self, query: str, from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict:
         """
@@ -69,10 +148,11 @@ class NewsAPIScraper(BaseScraper):
         for attempt in range(max_retries):
             try:
                 logger.info(f"Searching NewsAPI for: {query} (attempt {attempt + 1}/{max_retries})")
+                self.rate_limiter.wait()
                 response = self.session.get(endpoint, params=params, timeout=30)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _decode_json(response)
                     if data["status"] == "ok":
                         logger.info(f"Found {data.get('totalResults', 0)} results for query: {query}")
                         return data
@@ -101,7 +181,36 @@ class NewsAPIScraper(BaseScraper):
                 
         return {"status": "error", "articles": []}
     
-    def process_article(self, article_data: Dict) -> Optional[Dict]:
+    def _search_term(self, search_term: str) -> Optional[Dict]:
+        """
+        Run a single search from a worker thread, skipping it once a stop is requested
+        
+        Parameters:
+        -----------
+        search_term : str
+            Search query string
+            
+        Returns:
+        --------
+        Optional[Dict]
+            JSON response from the API, or None if the scraper was stopped
+        """
+        if self._stop_requested:
+            return None
+        return self.search_articles(search_term)
+    
+    @staticmethod
+    def _combined_text(article_data: Dict) -> str:
+        """Lowercased title, description and content used for article classification"""
+        # NewsAPI sends null for missing fields, so fall back to empty strings
+        return " ".join((
+            article_data.get("title") or "",
+            article_data.get("description") or "",
+            article_data.get("content") or ""
+        )).lower()
+    
+    def process_article(self, article_data: Dict, content_to_check: Optional[str] = None,
+                        business_related: Optional[bool] = None) -> Optional[Dict]:
         """
         Process a single article from NewsAPI response
         
@@ -109,6 +218,10 @@ class NewsAPIScraper(BaseScraper):
         -----------
         article_data : Dict
             Article data from NewsAPI
+        content_to_check : Optional[str]
+            Lowercased combined text of the article, if the caller already built it
+        business_related : Optional[bool]
+            Business relevance of the article, if the caller already checked it
             
         Returns:
         --------
@@ -123,26 +236,34 @@ class NewsAPIScraper(BaseScraper):
             url = article_data.get("url", "")
             date = article_data.get("publishedAt", "")
             source_name = article_data.get("source", {}).get("name", self.name)
+            if isinstance(source_name, str):
+                # Source names repeat across many articles
+                source_name = sys.intern(source_name)
             
             # Combine text for analysis
-            content_to_check = f"{title} {description} {content}".lower()
+            if content_to_check is None:
+                content_to_check = self._combined_text(article_data)
             
-            # Extract keywords and check if business related
-            keywords = extract_keywords(content_to_check)
-            business_related = is_business_related(content_to_check)
-            
-            # If no theft keywords found or not business related, skip
-            if not keywords or not business_related:
+            # Run the filters cheapest first so rejected articles skip the rest.
+            # The business check stops at the first matching keyword
+            if business_related is None:
+                business_related = is_business_related(content_to_check, already_lower=True)
+            if not business_related:
                 return None
                 
             # Detect location - ONLY keep articles in our target regions
-            location = detect_location(content_to_check)
+            location = detect_location(content_to_check, already_lower=True)
             if not location or location not in self.monitored_locations:
                 # Only process articles from our monitored locations
                 if location:
                     logger.debug(f"Article location '{location}' not in monitored locations")
                 return None
                 
+            # The full keyword scan only runs for articles that passed both filters
+            keywords = extract_keywords(content_to_check, already_lower=True)
+            if not keywords:
+                return None
+                
             # Create article object
             return {
                 "title": title,
@@ -153,14 +274,14 @@ class NewsAPIScraper(BaseScraper):
                 "keywords": keywords,
                 "is_theft_related": True,
                 "is_business_related": business_related,
-                "store_type": self._detect_store_type(content_to_check)
+                "store_type": self._detect_store_type(content_to_check, already_lower=True)
             }
             
         except Exception as e:
             logger.error(f"Error processing article: {e}")
             return None
             
-    def _detect_store_type(self, content: str) -> str:
+    def _detect_store_type(self, content: str, already_lower: bool = False) -> str:
         """
         Detect the type of store mentioned in the content
         
@@ -168,32 +289,18 @@ class NewsAPIScraper(BaseScraper):
         -----------
         content : str
             Content to analyze
+        already_lower : bool
+            Whether content is already lowercased, skipping a redundant copy
             
         Returns:
         --------
         str
             Detected store type or empty string if none detected
         """
-        # Keywords for different store types
-        store_types = {
-            "Jewelry Store": ["jewelry store", "jeweler", "jewellers", "jewelers", "jewelry shop"],
-            "Watch Store": ["watch store", "watch shop", "rolex dealer"],
-            "Sports Memorabilia": ["sports memorabilia", "sports collectibles", "sports cards", "sports merchandise"],
-            "Luxury Retail": ["luxury store", "luxury boutique", "high-end retail", "luxury goods"]
-        }
-        
-        content = content.lower()
+        if not already_lower:
+            content = content.lower()
         
-        # Check each store type
-        for store_type, keywords in store_types.items():
-            if any(keyword in content for keyword in keywords):
-                return store_type
-                
-        # Default to jewelry store if no specific type detected but contains jewelry terms
-        if any(term in content for term in ["jewelry", "jewellery", "diamond", "gold", "necklace", "bracelet"]):
-            return "Jewelry Store"
-            
-        return "High-Value Retail"
+        return _detect_store_type_lower(content)
     
     def scrape(self, deep_check: bool = True, max_deep_check: int = 20) -> Dict[str, List[Dict]]:
         """
@@ -221,43 +328,72 @@ class NewsAPIScraper(BaseScraper):
         # Also track unclassified articles
         location_articles["Other"] = []
         
-        # Search for each term
-        for search_term in self.config["search_terms"]:
-            try:
-                if self._stop_requested:
-                    logger.info("Stopping scraper as requested")
-                    break
-                    
-                # Search for articles
-                response = self.search_articles(search_term)
-                
-                if response.get("status") != "ok":
-                    logger.warning(f"Search failed for term: {search_term}")
-                    continue
-                
-                articles = response.get("articles", [])
-                logger.info(f"Processing {len(articles)} articles for search term: {search_term}")
-                
-                # Process each article
-                for article_data in articles:
+        # Search terms overlap heavily, so only process each article URL once
+        seen_urls = set()
+        
+        # Searches are network-bound, so run them concurrently and process the
+        # responses in search term order to keep results deterministic
+        with ThreadPoolExecutor(max_workers=self.config["max_concurrent_searches"]) as executor:
+            futures = [
+                (search_term, executor.submit(self._search_term, search_term))
+                for search_term in self.config["search_terms"]
+            ]
+            
+            for search_term, future in futures:
+                try:
                     if self._stop_requested:
+                        logger.info("Stopping scraper as requested")
+                        for _, pending in futures:
+                            pending.cancel()
                         break
                         
-                    processed_article = self.process_article(article_data)
+                    # Wait for this term's search results
+                    response = future.result()
+                    if response is None:
+                        continue
                     
-                    if processed_article:
-                        location = detect_location(processed_article["title"] + " " + processed_article["excerpt"])
-                        if location in location_articles:
-                            location_articles[location].append(processed_article)
-                        else:
-                            location_articles["Other"].append(processed_article)
-                
-                # Add a small delay between searches to be nice to the API
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error searching for term '{search_term}': {e}")
-                continue
+                    if response.get("status") != "ok":
+                        logger.warning(f"Search failed for term: {search_term}")
+                        continue
+                    
+                    articles = response.get("articles", [])
+                    logger.info(f"Processing {len(articles)} articles for search term: {search_term}")
+                    
+                    # Drop articles already seen under an earlier search term
+                    new_articles = []
+                    for article_data in articles:
+                        article_url = article_data.get("url")
+                        if article_url:
+                            if article_url in seen_urls:
+                                continue
+                            seen_urls.add(article_url)
+                        new_articles.append(article_data)
+                    
+                    # Screen the whole batch for business relevance in one scan so
+                    # irrelevant articles never reach per-article processing
+                    texts = [self._combined_text(article_data) for article_data in new_articles]
+                    candidates = business_related_flags(texts, already_lower=True)
+                    
+                    # Process each article, reusing the text and flag from the batch scan
+                    for article_data, text, is_candidate in zip(new_articles, texts, candidates):
+                        if self._stop_requested:
+                            break
+                        if not is_candidate:
+                            continue
+                            
+                        processed_article = self.process_article(article_data, text, business_related=True)
+                        
+                        if processed_article:
+                            summary_text = f"{processed_article['title']} {processed_article['excerpt']}".lower()
+                            location = detect_location(summary_text, already_lower=True)
+                            if location in location_articles:
+                                location_articles[location].append(processed_article)
+                            else:
+                                location_articles["Other"].append(processed_article)
+                    
+                except Exception as e:
+                    logger.error(f"Error searching for term '{search_term}': {e}")
+                    continue
         
         # Log summary
         total_articles = sum(len(articles) for articles in location_articles.values())
@@ -297,26 +433,28 @@ def main():
     # Write results to CSV
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'location', 'title', 'date', 'url', 'excerpt',
                 'source', 'keywords', 'is_theft_related', 'is_business_related'
             ])
-            writer.writeheader()
             
-            for location, articles in results.items():
-                for article in articles:
-                    row = {
-                        'location': location,
-                        'title': article['title'],
-                        'date': article['date'],
-                        'url': article['url'],
-                        'excerpt': article['excerpt'],
-                        'source': article['source'],
-                        'keywords': ','.join(article['keywords']),
-                        'is_theft_related': article['is_theft_related'],
-                        'is_business_related': article['is_business_related']
-                    }
-                    writer.writerow(row)
+            # Write every row in one call instead of a DictWriter row at a time
+            writer.writerows(
+                (
+                    location,
+                    article['title'],
+                    article['date'],
+                    article['url'],
+                    article['excerpt'],
+                    article['source'],
+                    ','.join(article['keywords']),
+                    article['is_theft_related'],
+                    article['is_business_related']
+                )
+                for location, articles in results.items()
+                for article in articles
+            )
         
         main_logger.info(f"Results saved to {output_file}")
         
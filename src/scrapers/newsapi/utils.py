@@ -9,14 +9,41 @@ This module provides specialized functions for processing news articles from New
 """
 
 import logging
-import re
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional
 from datetime import datetime
+from ..common.text_filters import (
+    keyword_pattern, make_keyword_extractor, make_keyword_matcher, make_location_detector,
+    parse_date, today
+)
 from .config import LOCATION_VARIATIONS, THEFT_KEYWORDS, BUSINESS_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
-def detect_location(content: str) -> Optional[str]:
+# Fallback formats for dates that are not ISO 8601
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%B %d, %Y',
+    '%B %d %Y',
+    '%b %d, %Y',
+    '%b %d %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%Y/%m/%d',
+    '%m/%d/%Y'
+)
+
+_detect_location = make_location_detector(LOCATION_VARIATIONS)
+_extract_keywords = make_keyword_extractor(THEFT_KEYWORDS)
+_is_business_related = make_keyword_matcher(BUSINESS_KEYWORDS)
+
+# Business keywords combined into one pattern for scanning a whole batch of
+# articles in a single pass
+_BUSINESS_PATTERN = keyword_pattern(BUSINESS_KEYWORDS)
+_BATCH_SEPARATOR = "\n\x1f\n"
+
+def detect_location(content: str, already_lower: bool = False) -> Optional[str]:
     """
     Detect location from content using location variations to identify sales territories.
     
@@ -27,29 +54,17 @@ def detect_location(content: str) -> Optional[str]:
     -----------
     content : str
         Content to analyze for location mentions
-        
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
+    
     Returns:
     --------
     Optional[str]
         Detected location or None if no location found
     """
-    content = content.lower()
-    
-    # First try to find state matches
-    for location, variations in LOCATION_VARIATIONS.items():
-        # Check state name and abbreviation first
-        state_variations = [variations[0], variations[1]]  # State name and abbreviation
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in state_variations):
-            return location
-            
-        # Then check cities
-        city_variations = variations[2:]  # All other variations are cities
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in city_variations):
-            return location
-                
-    return None
+    return _detect_location(content, already_lower=already_lower)
 
-def extract_keywords(content: str) -> List[str]:
+def extract_keywords(content: str, already_lower: bool = False) -> List[str]:
     """
     Extract theft-related keywords to qualify leads and determine product needs.
     
@@ -59,23 +74,17 @@ def extract_keywords(content: str) -> List[str]:
     -----------
     content : str
         Content to analyze for keywords
-        
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
+    
     Returns:
     --------
     List[str]
         List of found keywords indicating specific security needs
     """
-    content = content.lower()
-    keywords = []
-    
-    # Check theft keywords
-    for keyword in THEFT_KEYWORDS:
-        if re.search(r'\b' + re.escape(keyword) + r'\b', content):
-            keywords.append(keyword)
-            
-    return keywords
+    return _extract_keywords(content, already_lower=already_lower)
 
-def is_business_related(content: str) -> bool:
+def is_business_related(content: str, already_lower: bool = False) -> bool:
     """
     Filter for B2B sales opportunities by identifying business-related incidents.
     
@@ -85,14 +94,54 @@ def is_business_related(content: str) -> bool:
     -----------
     content : str
         Content to analyze for business relevance
-        
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
+    
     Returns:
     --------
     bool
         True if content contains business keywords indicating sales opportunity
     """
-    content = content.lower()
-    return any(re.search(r'\b' + re.escape(keyword) + r'\b', content) for keyword in BUSINESS_KEYWORDS)
+    return _is_business_related(content, already_lower=already_lower)
+
+def business_related_flags(contents: List[str], already_lower: bool = False) -> List[bool]:
+    """
+    Check business relevance for a whole batch of articles in one scan.
+    
+    Joins the contents into a single corpus, runs the combined business keyword
+    pattern over it once, and maps each match back to its article by offset.
+    Equivalent to calling is_business_related on each content.
+    
+    Parameters:
+    -----------
+    contents : List[str]
+        Article contents to analyze for business relevance
+    already_lower : bool
+        Whether contents are already lowercased, skipping a redundant copy
+    
+    Returns:
+    --------
+    List[bool]
+        One flag per content, True if it contains a business keyword
+    """
+    flags = [False] * len(contents)
+    if not contents:
+        return flags
+    
+    if not already_lower:
+        contents = [content.lower() for content in contents]
+    
+    # Start offset of each content within the joined corpus
+    offsets = []
+    position = 0
+    for content in contents:
+        offsets.append(position)
+        position += len(content) + len(_BATCH_SEPARATOR)
+    
+    for match in _BUSINESS_PATTERN.finditer(_BATCH_SEPARATOR.join(contents)):
+        flags[bisect_right(offsets, match.start()) - 1] = True
+    
+    return flags
 
 def standardize_date(date_str: str) -> str:
     """
@@ -105,43 +154,47 @@ def standardize_date(date_str: str) -> str:
     -----------
     date_str : str
         Date string to standardize
-        
+    
     Returns:
     --------
     str
         Standardized date string in YYYY-MM-DD format
     """
     if not date_str:
-        return datetime.now().strftime('%Y-%m-%d')
-        
+        return today()
+    
     try:
-        # Handle ISO 8601 format (standard for NewsAPI)
-        date_str = date_str.split('T')[0] if 'T' in date_str else date_str
-        
-        # Try different date formats
-        formats = [
-            '%Y-%m-%d',
-            '%B %d, %Y',
-            '%B %d %Y',
-            '%b %d, %Y',
-            '%b %d %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%Y/%m/%d',
-            '%m/%d/%Y'
-        ]
-        
-        for fmt in formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-                
-        # If no format matches, use current date
-        logger.warning(f"Could not parse date: {date_str}")
-        return datetime.now().strftime('%Y-%m-%d')
-        
+        parsed_date = _parse_date(date_str)
     except Exception as e:
         logger.error(f"Error parsing date '{date_str}': {e}")
-        return datetime.now().strftime('%Y-%m-%d')
\ No newline at end of file
+        return today()
+    
+    if parsed_date is None:
+        # If no format matches, use current date
+        logger.warning(f"Could not parse date: {date_str}")
+        return today()
+    
+    return parsed_date
+
+@lru_cache(maxsize=2048)
+def _parse_date(date_str: str) -> Optional[str]:
+    """
+    Cached date parsing shared by every call to standardize_date.
+    
+    Articles published around the same time repeat the same timestamp, so
+    results are memoized on the raw string. Returns None when no format
+    matches, leaving logging and the current-date fallback to the caller.
+    """
+    # Handle ISO 8601 format (standard for NewsAPI)
+    date_str = date_str.strip()
+    if 'T' in date_str:
+        date_str = date_str.split('T', 1)[0]
+    
+    # Fast path: NewsAPI dates are ISO 8601, so one parse covers nearly all of them
+    try:
+        return datetime.fromisoformat(date_str).strftime('%Y-%m-%d')
+    except ValueError:
+        pass
+    
+    # Try the remaining date formats
+    return parse_date(date_str, DATE_FORMATS)
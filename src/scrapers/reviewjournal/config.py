@@ -7,6 +7,26 @@ from ..jsa.config import MONITORED_LOCATIONS, LOCATION_VARIATIONS
 REVIEWJOURNAL_CONFIG = {
     "name": "Las Vegas Review Journal",
     "url": "https://www.reviewjournal.com/crime/",
+    # Static HTML with at least this many article links is parsed directly;
+    # otherwise the page is rendered with Selenium
+    "min_static_article_links": 5,
+    # Idle WebDrivers kept alive for reuse by later scrapes in the same process
+    "driver_pool_size": 2,
+    # Static downloads stop at the first of these markers, since everything
+    # after the article listing is footer, ads and widgets
+    "stream_stop_markers": ["</main>", 'id="footer"'],
+    # Classified articles are cached by URL in this file under the output
+    # directory so later runs only classify new links
+    "article_cache_file": "reviewjournal_article_cache",
+    # Cached articles older than this are classified again, picking up updated
+    # dates and excerpts, and pruned from the cache file
+    "article_cache_max_age_hours": 24,
+    # The whole cache file is swept for expired articles at most this often;
+    # in between, expired articles are only dropped when they are read
+    "article_cache_prune_interval_hours": 24,
+    # ETag/Last-Modified of the last fetched listing, sent back on the next run
+    # so an unchanged page costs a single 304 response
+    "http_validators_file": "reviewjournal_http_validators.json",
     "selectors": {
         "posts": [
             ".rj-story",
@@ -5,38 +5,94 @@ This module provides a Selenium-based scraper for the Las Vegas Review Journal c
 extracting theft incidents and related information with a focus on Las Vegas area.
 """
 
+import hashlib
+import json
+import logging
+import shelve
+import sys
 import time
 import re
 import requests
 import os
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from ..base import BaseScraper, Article
-from .config import REVIEWJOURNAL_CONFIG, MONITORED_LOCATIONS
-from .utils import detect_location, extract_keywords, is_business_related, standardize_date, extract_location_details
+from ..common.webdriver import (
+    DriverPool, PooledDriverMixin, chrome_user_data_dir, chromedriver_path, http_session
+)
+from .config import (
+    REVIEWJOURNAL_CONFIG, MONITORED_LOCATIONS, LOCATION_VARIATIONS, THEFT_KEYWORDS, BUSINESS_KEYWORDS
+)
+from .utils import classify_article, detect_location, extract_location_details
 from src.utils.logger import get_logger
 from src.utils.exceptions import ScraperNetworkError, ScraperParsingError
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
-class ReviewJournalScraper(BaseScraper):
+# Links into the crime/local sections, used to tell whether static HTML already
+# contains the article listing
+ARTICLE_LINK_PATTERN = re.compile(r'href="(?:https?://www\.reviewjournal\.com)?/(?:crime|local)/')
+
+# Project output directory for CSV results and the article cache
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "output")
+
+# Returned by fetch_page when the server reports the page unchanged since the
+# last run; the relevant article URLs of that run are cached under LISTING_KEY_PREFIX + url
+NOT_MODIFIED = object()
+LISTING_KEY_PREFIX = "listing:"
+
+# Article cache key holding the time of the last full sweep for stale entries
+PRUNED_AT_KEY = "pruned_at"
+
+# Number of article links the last fully scrolled render of a page had, cached
+# under this prefix + url; static HTML with fewer links is missing articles
+# that only load on scroll
+RENDERED_LINKS_KEY_PREFIX = "rendered_links:"
+
+# Cached articles are only reused while the keywords and locations they were
+# classified with are unchanged
+ARTICLE_CACHE_VERSION = hashlib.sha1(
+    json.dumps([THEFT_KEYWORDS, BUSINESS_KEYWORDS, LOCATION_VARIATIONS]).encode()
+).hexdigest()
+
+# Tags read from the listing page: article links and the dates and excerpts after them
+LISTING_TAGS = frozenset(('a', 'time', 'p'))
+
+# URL filters applied to every link on the listing page
+BASE_URL = "https://www.reviewjournal.com"
+ARTICLE_URL_PATTERN = re.compile(r'/(?:crime|local)/')
+SKIP_URL_PATTERN = re.compile(r'/subscribe/')
+
+class ReviewJournalScraper(PooledDriverMixin, BaseScraper):
     """Selenium-based Review Journal scraper implementation"""
     
+    # Idle drivers shared by every scraper instance so a browser is started at
+    # most once per pooled slot rather than once per scrape
+    _driver_pool = DriverPool(REVIEWJOURNAL_CONFIG["driver_pool_size"])
+    
     def __init__(self):
         super().__init__(REVIEWJOURNAL_CONFIG["name"], REVIEWJOURNAL_CONFIG["url"])
         self.config = REVIEWJOURNAL_CONFIG
         self.monitored_locations = MONITORED_LOCATIONS
         self.driver = None
+        
+        # Set when the current driver hit a navigation or script error; such a
+        # driver is quit instead of being returned to the pool
+        self._driver_dirty = False
+        
+        # ETag/Last-Modified of the page last fetched with requests; only saved
+        # once the listing parsed from that page is in the article cache, so a
+        # failed run never leaves validators pointing at a listing it did not store
+        self._pending_validators: Optional[Dict[str, str]] = None
     
     def setup_driver(self):
         """Set up and return a configured Chrome/Chromium WebDriver"""
@@ -51,6 +107,17 @@ class ReviewJournalScraper(BaseScraper):
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-software-rasterizer')
         
+        # Only the HTML is needed, so skip images, notifications and background traffic
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-translate')
+        chrome_options.add_argument('--mute-audio')
+        
         # Create the driver with retry logic
         max_retries = 3
         for attempt in range(max_retries):
@@ -62,11 +129,7 @@ class ReviewJournalScraper(BaseScraper):
                     logger.info("Attempting to use Chromium directly")
                     chrome_options.binary_location = "/usr/bin/chromium-browser"
                     # Add a unique user data directory to avoid conflicts
-                    import tempfile
-                    import uuid
-                    temp_dir = tempfile.mkdtemp(prefix="chromium_data_")
-                    unique_id = str(uuid.uuid4())
-                    user_data_dir = os.path.join(temp_dir, unique_id)
+                    user_data_dir = chrome_user_data_dir()
                     chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
                     logger.info(f"Using temporary user data directory: {user_data_dir}")
                     self.driver = webdriver.Chrome(options=chrome_options)
@@ -77,7 +140,7 @@ class ReviewJournalScraper(BaseScraper):
                     
                     # Fall back to webdriver_manager approach
                     logger.info("Falling back to webdriver_manager")
-                    service = Service(ChromeDriverManager().install())
+                    service = Service(chromedriver_path())
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                     self.driver.set_page_load_timeout(30)
                     return self.driver
@@ -96,20 +159,52 @@ class ReviewJournalScraper(BaseScraper):
         logger.error("Failed to create WebDriver after all retries")
         return None
     
-    def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a page with retry logic and better timeout handling"""
+    def fetch_page(self, url: str, conditional: bool = False,
+                   min_article_links: Optional[int] = None) -> Optional[str]:
+        """
+        Fetch a page, using Selenium only when the static HTML lacks the article listing
+        
+        Parameters:
+        -----------
+        url : str
+            URL of the page to fetch
+        conditional : bool
+            Whether to send the validators saved from the last fetch of this URL
+        min_article_links : Optional[int]
+            Article links static HTML needs to be used without rendering; never
+            below the configured min_static_article_links
+            
+        Returns:
+        --------
+        Optional[str]
+            Page HTML, NOT_MODIFIED if a conditional request found the page
+            unchanged, or None if the page could not be fetched
+        """
+        # Fast path: plain HTTP avoids starting a browser when the listing is
+        # already in the server-rendered HTML
+        page_content = self._fetch_with_requests(url, conditional=conditional)
+        if page_content is NOT_MODIFIED:
+            return page_content
+        if page_content and self._has_article_listing(page_content, min_article_links or 0):
+            return page_content
+            
+        logger.info("Static HTML lacks the article listing, rendering with Selenium")
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempting to fetch page with Selenium (attempt {attempt + 1}/{max_retries}): {url}")
                 
+                # Replace a driver that failed on an earlier attempt
+                if self.driver and self._driver_dirty:
+                    self._release_driver()
+                    
                 # Ensure we have a driver
                 if not self.driver:
-                    self.setup_driver()
+                    self._acquire_driver()
                 
-                # If still no driver, use requests as fallback
+                # If still no driver, keep whatever requests returned
                 if not self.driver:
-                    return self._fetch_with_requests(url)
+                    return page_content
                 
                 # Set a shorter timeout for initial page load
                 self.driver.set_page_load_timeout(15)
@@ -146,39 +241,52 @@ class ReviewJournalScraper(BaseScraper):
                 
             except Exception as e:
                 logger.error(f"Error fetching page (attempt {attempt + 1}): {str(e)}")
+                self._driver_dirty = True
                 if attempt < max_retries - 1:
                     time.sleep(2)  # Short delay before retry
                 continue
         
-        # If Selenium fails completely, try with requests as a fallback
-        logger.info("Selenium failed, trying with requests as fallback")
-        return self._fetch_with_requests(url)
+        # If Selenium fails completely, fall back to the static HTML
+        logger.info("Selenium failed, using the static HTML from requests")
+        return page_content
     
-    def _fetch_with_requests(self, url: str) -> Optional[str]:
-        """Fallback method to fetch page with requests if Selenium fails"""
+    def _has_article_listing(self, page_content: str, min_article_links: int = 0) -> bool:
+        """Check whether static HTML already contains enough article links to parse"""
+        minimum = max(self.config["min_static_article_links"], min_article_links)
+        for count, _ in enumerate(ARTICLE_LINK_PATTERN.finditer(page_content), 1):
+            if count >= minimum:
+                return True
+        return False
+    
+    def _fetch_with_requests(self, url: str, conditional: bool = False) -> Optional[str]:
+        """Fetch page HTML with the shared requests session, or NOT_MODIFIED on a 304"""
+        headers = self._conditional_headers(url) if conditional else {}
+        self._pending_validators = None
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempting to fetch page with requests (attempt {attempt + 1}/{max_retries}): {url}")
                 
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                }
-                
-                response = requests.get(url, headers=headers, timeout=15)
-                
-                if response.status_code == 200:
-                    page_content = response.text
-                    
-                    if not page_content or len(page_content.strip()) < 100:
-                        logger.warning("Page content from requests is empty or too short")
-                        continue
+                # Stream the body so the download can stop after the article listing
+                with http_session.get(url, headers=headers, timeout=15, stream=True) as response:
+                    if response.status_code == 304:
+                        logger.info(f"Page not modified since the last fetch: {url}")
+                        return NOT_MODIFIED
                         
-                    return page_content
-                else:
-                    logger.error(f"Failed to fetch page with requests. Status code: {response.status_code}")
+                    if response.status_code == 200:
+                        page_content = self._read_until_listing_end(response)
+                        
+                        if not page_content or len(page_content.strip()) < 100:
+                            logger.warning("Page content from requests is empty or too short")
+                            continue
+                            
+                        self._pending_validators = {
+                            "etag": response.headers.get('ETag'),
+                            "last_modified": response.headers.get('Last-Modified')
+                        }
+                        return page_content
+                    else:
+                        logger.error(f"Failed to fetch page with requests. Status code: {response.status_code}")
                     
             except Exception as e:
                 logger.error(f"Error fetching page with requests (attempt {attempt + 1}): {str(e)}")
@@ -186,45 +294,237 @@ class ReviewJournalScraper(BaseScraper):
             if attempt < max_retries - 1:
                 time.sleep(2)  # Short delay before retry
                 
-        logger.error("Failed to fetch page with both Selenium and requests")
+        logger.error("Failed to fetch page with requests")
         return None
     
-    def scroll_to_load_more(self, max_scrolls=10):
+    def _validators_path(self) -> str:
+        """Path of the JSON file holding HTTP validators by URL"""
+        return os.path.join(OUTPUT_DIR, self.config["http_validators_file"])
+    
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load saved ETag/Last-Modified values, keyed by URL"""
+        try:
+            with open(self._validators_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the last fetch of url"""
+        validators = self._load_validators().get(url, {})
+        headers = {}
+        if validators.get("etag"):
+            headers['If-None-Match'] = validators["etag"]
+        if validators.get("last_modified"):
+            headers['If-Modified-Since'] = validators["last_modified"]
+        return headers
+    
+    def _save_validators(self, url: str, url_validators: Dict[str, str]):
+        """Remember a fetched page's ETag/Last-Modified for the next conditional fetch"""
+        validators = self._load_validators()
+        validators[url] = url_validators
+        try:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            with open(self._validators_path(), 'w', encoding='utf-8') as f:
+                json.dump(validators, f)
+        except OSError as e:
+            logger.warning(f"Could not save HTTP validators: {str(e)}")
+    
+    def _read_until_listing_end(self, response: requests.Response) -> str:
         """
-        Scroll down the page to load more dynamically loaded content
+        Read a streamed response body, stopping once the article listing has ended
         
         Parameters:
         -----------
-        max_scrolls : int
-            Maximum number of scroll operations to perform
+        response : requests.Response
+            Response opened with stream=True
+            
+        Returns:
+        --------
+        str
+            Decoded HTML up to and including the first stop marker, or the whole
+            body if no marker appears
         """
-        try:
-            if not self.driver:
-                logger.warning("No driver available for scrolling")
-                return
-                
-            logger.info(f"Starting scroll operation to load more content (max: {max_scrolls})")
-            initial_height = self.driver.execute_script("return document.body.scrollHeight")
+        markers = [marker.encode() for marker in self.config["stream_stop_markers"]]
+        overlap = max(len(marker) for marker in markers) - 1
+        buffer = bytearray()
+        
+        for chunk in response.iter_content(chunk_size=8192):
+            # Only search the new chunk plus enough of the old tail to catch a
+            # marker split across chunks
+            search_from = max(len(buffer) - overlap, 0)
+            buffer += chunk
+            positions = [buffer.find(marker, search_from) for marker in markers]
+            found = [(position, len(marker)) for position, marker in zip(positions, markers) if position != -1]
+            if found:
+                position, length = min(found)
+                del buffer[position + length:]
+                break
+                
+        return buffer.decode(response.encoding or 'utf-8', errors='replace')
+    
+    def _collect_links(self, soup: BeautifulSoup) -> List[List]:
+        """
+        Collect candidate article links with the first <time> and <p> after each
+        
+        Walks the document once in order instead of searching forward from every
+        link, so the cost stays linear in page size however many links there are.
+        
+        Parameters:
+        -----------
+        soup : BeautifulSoup
+            Parsed listing page
             
-            for i in range(max_scrolls):
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        Returns:
+        --------
+        List[List]
+            [title, url, date element, excerpt element] for each article link, in
+            page order; the elements are None when no later <time>/<p> exists
+        """
+        links = []
+        waiting_for_date = []
+        waiting_for_excerpt = []
+        
+        # Iterate lazily instead of materializing a list of every matching tag;
+        # text nodes have no name and are skipped by the same check
+        for element in soup.descendants:
+            name = element.name
+            if name not in LISTING_TAGS:
+                continue
                 
-                # Wait for content to load
-                time.sleep(2)
+            if name == 'time':
+                # First <time> after every link still waiting for one
+                for link in waiting_for_date:
+                    link[2] = element
+                waiting_for_date = []
+                continue
                 
-                # Calculate new scroll height and compare to last scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == initial_height:
-                    # No new content loaded, stop scrolling
-                    logger.info(f"No new content after scroll {i+1}, stopping")
-                    break
-                    
-                initial_height = new_height
-                logger.info(f"Completed scroll {i+1}/{max_scrolls}, new height: {new_height}")
+            if name == 'p':
+                for link in waiting_for_excerpt:
+                    link[3] = element
+                waiting_for_excerpt = []
+                continue
+                
+            url = element.get('href')
+            if url is None:
+                continue
+                
+            # Make sure URL is absolute
+            if not url.startswith('http'):
+                url = f"{BASE_URL}{url}" if url.startswith('/') else f"{BASE_URL}/{url}"
+            
+            # Skip non-article URLs and subscription pages before touching the link text
+            if not ARTICLE_URL_PATTERN.search(url) or SKIP_URL_PATTERN.search(url):
+                continue
+                
+            # Skip links without text or with very short text. Most anchors hold a
+            # single text node, which .string returns without walking descendants;
+            # comments and mixed content still go through get_text
+            link_text = element.string
+            if type(link_text) is NavigableString:
+                link_text = link_text.strip()
+            else:
+                link_text = element.get_text(strip=True)
+            if not link_text or len(link_text) < 10:
+                continue
                 
+            link = [link_text, url, None, None]
+            links.append(link)
+            waiting_for_date.append(link)
+            waiting_for_excerpt.append(link)
+            
+        return links
+    
+    def _classify_link(self, link: List) -> Optional[Dict]:
+        """
+        Build the article dictionary for a collected link if it is relevant
+        
+        Parameters:
+        -----------
+        link : List
+            [title, url, date element, excerpt element] from _collect_links
+            
+        Returns:
+        --------
+        Optional[Dict]
+            Article data, or None if the link is neither theft nor business related
+        """
+        title, url, date_elem, excerpt_elem = link
+        
+        article_obj = classify_article(
+            title,
+            url,
+            date_elem.get_text(strip=True) if date_elem else None,
+            excerpt_elem.get_text(strip=True) if excerpt_elem else "",
+            self.name
+        )
+        
+        # Log details for monitoring; skipped entirely, formatting included, when
+        # INFO is disabled since this runs once per link
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Found article: %s", title)
+            logger.info("Article keywords: %s", article_obj['keywords'] if article_obj else [])
+            logger.info("Business related: %s", article_obj['is_business_related'] if article_obj else False)
+        
+        return article_obj
+    
+    def _open_article_cache(self):
+        """Open the persistent URL -> article cache, or an in-memory one if it is unavailable"""
+        try:
+            os.makedirs(OUTPUT_DIR, exist_ok=True)
+            article_cache = shelve.open(os.path.join(OUTPUT_DIR, self.config["article_cache_file"]))
         except Exception as e:
-            logger.error(f"Error during scroll operation: {str(e)}")
+            logger.warning(f"Could not open article cache, classifying every link: {str(e)}")
+            return {}
+            
+        self._prune_article_cache(article_cache)
+        return article_cache
+    
+    def _prune_article_cache(self, article_cache):
+        """
+        Drop every expired or mismatched entry, at most once per prune interval
+        
+        _cache_get already drops the stale entries it reads; this sweep catches
+        articles that dropped off the listing and are never read again, without
+        unpickling the whole cache on every run.
+        """
+        try:
+            pruned_at = article_cache.get(PRUNED_AT_KEY)
+        except Exception:
+            pruned_at = None
+        interval = self.config["article_cache_prune_interval_hours"] * 3600
+        if isinstance(pruned_at, float) and time.time() - pruned_at < interval:
+            return
+            
+        for key in list(article_cache.keys()):
+            if key != PRUNED_AT_KEY:
+                self._cache_get(article_cache, key)
+        article_cache[PRUNED_AT_KEY] = time.time()
+    
+    def _cache_get(self, article_cache, key: str):
+        """
+        Return the value cached under key, or None if it is missing, expired or
+        from another configuration; such stale entries are dropped as they are read
+        """
+        try:
+            entry = article_cache.get(key)
+        except Exception:
+            # Unreadable entry, e.g. pickled by an incompatible version
+            entry = {}
+        if entry is None:
+            return None
+        if (not isinstance(entry, dict) or entry.get("version") != ARTICLE_CACHE_VERSION or
+                time.time() - entry["stored_at"] > self.config["article_cache_max_age_hours"] * 3600):
+            try:
+                del article_cache[key]
+            except KeyError:
+                pass
+            return None
+        return entry["value"]
+    
+    def _cache_put(self, article_cache, key: str, value):
+        """Cache value under key, stamped with the current time and configuration"""
+        article_cache[key] = {"version": ARTICLE_CACHE_VERSION, "stored_at": time.time(), "value": value}
     
     def scrape_crime_news(self, max_pages: int = None) -> Dict[str, List[Dict]]:
         """
@@ -242,108 +542,94 @@ class ReviewJournalScraper(BaseScraper):
         """
         logger.info("Starting Review Journal crime news scraper...")
         
-        # Dictionary to store articles by location
-        location_articles = {}
-        for location in self.monitored_locations:
-            location_articles[location] = []
-        
-        # Also track unclassified articles
-        location_articles["Other"] = []
+        # Dictionary to store articles by location; every monitored location and
+        # "Other" (unclassified articles) is always present, even when empty
+        location_articles = {location: [] for location in (*self.monitored_locations, "Other")}
         
+        article_cache = self._open_article_cache()
         try:
-            # Set up the driver
-            self.setup_driver()
-            
-            # Get the crime page
+            # A conditional request is only worth sending if the last listing and
+            # every article on it are still cached
             current_url = self.config["url"]
-            page_content = self.fetch_page(current_url)
-            
-            if not page_content:
-                logger.error("Failed to get the crime page")
-                return location_articles
-                
-            # Use Selenium to scroll and load more content
-            self.scroll_to_load_more(max_scrolls=5)
-            
-            # Get the updated page content after scrolling
-            page_content = self.driver.page_source
-            soup = BeautifulSoup(page_content, 'html.parser')
-            
-            # Extract all article titles and URLs
-            articles = []
+            listing_key = LISTING_KEY_PREFIX + current_url
+            cached_articles = None
+            listing = self._cache_get(article_cache, listing_key)
+            if listing is not None:
+                cached_articles = [self._cache_get(article_cache, url) for url in listing]
+                if not all(cached_articles):
+                    cached_articles = None
+                    
+            # Get the crime page; the driver is only started if static HTML is not
+            # enough. Static HTML is only trusted once a rendered, scrolled page has
+            # shown how many article links the listing has; until then it is rendered
+            rendered_key = RENDERED_LINKS_KEY_PREFIX + current_url
+            rendered_links = self._cache_get(article_cache, rendered_key)
+            page_content = self.fetch_page(
+                current_url,
+                conditional=cached_articles is not None,
+                min_article_links=sys.maxsize if rendered_links is None else rendered_links
+            )
             
-            # Get all links with href attributes
-            for link in soup.find_all('a', href=True):
-                # Skip links without text or with very short text
-                link_text = link.get_text(strip=True)
-                if not link_text or len(link_text) < 10:
-                    continue
+            if page_content is NOT_MODIFIED:
+                # Nothing new: rebuild the results from the cached articles without parsing
+                relevant_articles = cached_articles
+            else:
+                if not page_content:
+                    logger.error("Failed to get the crime page")
+                    return location_articles
                     
-                url = link['href']
-                
-                # Make sure URL is absolute
-                if not url.startswith('http'):
-                    url = f"https://www.reviewjournal.com{url}" if url.startswith('/') else f"https://www.reviewjournal.com/{url}"
-                
-                # Skip non-article URLs
-                if '/crime/' not in url and '/local/' not in url:
-                    continue
+                if self.driver:
+                    # Use Selenium to scroll and load more content
+                    self.scroll_to_load_more(max_scrolls=5)
                     
-                # Skip subscription pages
-                if '/subscribe/' in url:
-                    continue
-                
-                # Extract date if available
-                date = ""
-                date_elem = link.find_next('time')
-                if date_elem:
-                    date = standardize_date(date_elem.get_text(strip=True))
-                
-                # Get excerpt if available (usually in a paragraph after the link)
-                excerpt = ""
-                excerpt_elem = link.find_next('p')
-                if excerpt_elem:
-                    excerpt = excerpt_elem.get_text(strip=True)
-                
-                # Make sure we have a title
-                title = link_text
-                
-                # Check if this is a crime/theft related article
-                content_to_check = f"{title} {excerpt}".lower() if excerpt else title.lower()
-                
-                # Extract keywords and check if business related
-                keywords = extract_keywords(content_to_check)
-                business_related = is_business_related(content_to_check)
-                
-                # Log details for monitoring
-                logger.info(f"Found article: {title}")
-                logger.info(f"Article keywords: {keywords}")
-                logger.info(f"Business related: {business_related}")
-                
-                # Skip non-relevant articles
-                if not keywords and not business_related:
-                    continue
-                
-                # Create article object
-                article_obj = {
-                    "title": title,
-                    "url": url,
-                    "date": date,
-                    "excerpt": excerpt,
-                    "source": self.name,
-                    "keywords": keywords,
-                    "is_theft_related": bool(keywords),
-                    "is_business_related": business_related,
-                    "detailed_location": ""
-                }
-                
-                # All Review Journal articles are from Nevada by default
-                location_articles["Nevada"].append(article_obj)
-                
-                logger.info(f"Processed article: {title}")
+                    # Get the updated page content after scrolling
+                    page_content = self.driver.page_source
+                    self._cache_put(
+                        article_cache, rendered_key, len(ARTICLE_LINK_PATTERN.findall(page_content))
+                    )
+                    
+                soup = BeautifulSoup(page_content, 'lxml')
+                
+                # Extract all article titles and URLs along with their date and excerpt elements
+                articles = self._collect_links(soup)
+                
+                # Only links without a cached article are classified. Irrelevant links
+                # are never cached, so they are classified again on every fetch. A URL
+                # linked several times (e.g. from a teaser and a headline) keeps its
+                # first relevant anchor, so an irrelevant nav link cannot hide it
+                classified = {}
+                uncached = set()
+                for link in articles:
+                    url = link[1]
+                    if url in classified:
+                        continue
+                    if url not in uncached:
+                        article_obj = self._cache_get(article_cache, url)
+                        if article_obj is not None:
+                            classified[url] = article_obj
+                            continue
+                        uncached.add(url)
+                    article_obj = self._classify_link(link)
+                    if article_obj:
+                        classified[url] = article_obj
+                        self._cache_put(article_cache, url, article_obj)
+                            
+                relevant_urls = list(classified)
+                relevant_articles = list(classified.values())
+                self._cache_put(article_cache, listing_key, relevant_urls)
+                
+                # The listing is stored, so the next run may send the validators
+                # of the page it came from and trust a 304
+                if self._pending_validators:
+                    if isinstance(article_cache, shelve.Shelf):
+                        article_cache.sync()
+                    self._save_validators(current_url, self._pending_validators)
+                
+            # All Review Journal articles are from Nevada by default
+            location_articles["Nevada"].extend(relevant_articles)
             
             # Count total articles
-            total_articles = sum(len(articles) for articles in location_articles.values() if articles)
+            total_articles = sum(map(len, location_articles.values()))
             logger.info(f"Successfully processed {total_articles} relevant articles")
             
             return location_articles
@@ -353,11 +639,11 @@ class ReviewJournalScraper(BaseScraper):
             return location_articles
             
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            if isinstance(article_cache, shelve.Shelf):
+                article_cache.close()
+                
+            # Keep the browser alive for the next scrape instead of quitting it
+            self._release_driver()
     
     def scrape(self, deep_check: bool = True, max_deep_check: int = 20) -> Dict[str, List[Dict]]:
         """
@@ -396,7 +682,7 @@ def main():
     results = run_scraper()
     
     # Create output directory if it doesn't exist
-    output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), "output")
+    output_dir = OUTPUT_DIR
     os.makedirs(output_dir, exist_ok=True)
     
     # Generate filename with timestamp
@@ -410,28 +696,30 @@ def main():
     # Write results to CSV
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'location', 'title', 'date', 'url', 'excerpt',
                 'source', 'keywords', 'is_theft_related', 'is_business_related',
                 'detailed_location'
             ])
-            writer.writeheader()
             
-            for location, articles in results.items():
-                for article in articles:
-                    row = {
-                        'location': location,
-                        'title': article['title'],
-                        'date': article['date'],
-                        'url': article['url'],
-                        'excerpt': article['excerpt'],
-                        'source': article['source'],
-                        'keywords': ','.join(article['keywords']),
-                        'is_theft_related': article['is_theft_related'],
-                        'is_business_related': article['is_business_related'],
-                        'detailed_location': article.get('detailed_location', '')
-                    }
-                    writer.writerow(row)
+            # Write every row in one call instead of a DictWriter row at a time
+            writer.writerows(
+                (
+                    location,
+                    article['title'],
+                    article['date'],
+                    article['url'],
+                    article['excerpt'],
+                    article['source'],
+                    ','.join(article['keywords']),
+                    article['is_theft_related'],
+                    article['is_business_related'],
+                    article.get('detailed_location', '')
+                )
+                for location, articles in results.items()
+                for article in articles
+            )
         
         main_logger.info(f"Results saved to {output_file}")
         
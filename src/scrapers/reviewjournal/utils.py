@@ -10,12 +10,33 @@ This module provides specialized functions for processing Review Journal crime n
 
 import re
 import logging
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from ..common.text_filters import (
+    make_keyword_extractor, make_keyword_matcher, make_location_detector, make_text_analyzer, parse_date, today
+)
 from .config import LOCATION_VARIATIONS, THEFT_KEYWORDS, BUSINESS_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%B %d, %Y',
+    '%B %d %Y',
+    '%b %d, %Y',
+    '%b %d %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%m/%d/%y'
+)
+
+# Nevada is checked before any other location and assumed when none is mentioned
+_detect_location = make_location_detector(LOCATION_VARIATIONS, preferred="Nevada", default="Nevada")
+_extract_keywords = make_keyword_extractor(THEFT_KEYWORDS)
+_is_business_related = make_keyword_matcher(BUSINESS_KEYWORDS)
+_analyze_text = make_text_analyzer(THEFT_KEYWORDS, BUSINESS_KEYWORDS)
+
 def detect_location(content: str) -> Optional[str]:
     """
     Detect location from content, with enhanced focus on Nevada cities.
@@ -33,34 +54,7 @@ def detect_location(content: str) -> Optional[str]:
     Optional[str]
         Detected location or None if no location found
     """
-    content = content.lower()
-    
-    # First try to find Nevada-specific matches since Review Journal is a Nevada news source
-    nevada_variations = LOCATION_VARIATIONS.get("Nevada", [])
-    # Since it's Las Vegas Review Journal, default to Nevada if no other location is found
-    location_found = "Nevada"
-    
-    # Check if Nevada is explicitly mentioned
-    if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in nevada_variations):
-        return "Nevada"
-    
-    # Then check other locations
-    for location, variations in LOCATION_VARIATIONS.items():
-        if location == "Nevada":  # Already checked
-            continue
-            
-        # Check state name and abbreviation first
-        state_variations = [variations[0], variations[1]]  # State name and abbreviation
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in state_variations):
-            return location
-            
-        # Then check cities
-        city_variations = variations[2:]  # All other variations are cities
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in city_variations):
-            return location
-                
-    # If no specific location is found, default to Nevada for Las Vegas Review Journal
-    return location_found
+    return _detect_location(content)
 
 def extract_keywords(content: str) -> List[str]:
     """
@@ -78,15 +72,7 @@ def extract_keywords(content: str) -> List[str]:
     List[str]
         List of found keywords indicating specific security needs
     """
-    content = content.lower()
-    keywords = []
-    
-    # Check theft keywords
-    for keyword in THEFT_KEYWORDS:
-        if re.search(r'\b' + re.escape(keyword) + r'\b', content):
-            keywords.append(keyword)
-            
-    return keywords
+    return _extract_keywords(content)
 
 def is_business_related(content: str) -> bool:
     """
@@ -104,8 +90,75 @@ def is_business_related(content: str) -> bool:
     bool
         True if content contains business keywords indicating sales opportunity
     """
-    content = content.lower()
-    return any(re.search(r'\b' + re.escape(keyword) + r'\b', content) for keyword in BUSINESS_KEYWORDS)
+    return _is_business_related(content)
+
+def analyze_text(content: str, already_lower: bool = False) -> Tuple[List[str], bool]:
+    """
+    Extract theft keywords and check business relevance with one lowercase copy.
+    
+    Parameters:
+    -----------
+    content : str
+        Content to analyze
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
+        
+    Returns:
+    --------
+    Tuple[List[str], bool]
+        Found theft keywords and whether the content is business related
+    """
+    return _analyze_text(content, already_lower=already_lower)
+
+def classify_article(title: str, url: str, date_text: Optional[str], excerpt: str, source: str) -> Optional[Dict]:
+    """
+    Build the article dictionary for a listing link if it is theft or business related.
+    
+    Works on plain strings only, with every local annotated, so the per-link
+    classification can be profiled or compiled (e.g. with mypyc) separately from
+    the HTML handling in the scraper.
+    
+    Parameters:
+    -----------
+    title : str
+        Link text
+    url : str
+        Absolute article URL
+    date_text : Optional[str]
+        Text of the date element next to the link, or None if there is none
+    excerpt : str
+        Excerpt paragraph text, or an empty string
+    source : str
+        Source name stored on the article
+        
+    Returns:
+    --------
+    Optional[Dict]
+        Article data, or None if the link is neither theft nor business related
+    """
+    date: str = standardize_date(date_text) if date_text is not None else ""
+    
+    # Extract keywords and check if business related from one lowercase copy
+    content_to_check: str = f"{title} {excerpt}".lower() if excerpt else title.lower()
+    keywords: List[str]
+    business_related: bool
+    keywords, business_related = analyze_text(content_to_check, already_lower=True)
+    
+    # Skip non-relevant articles
+    if not keywords and not business_related:
+        return None
+    
+    return {
+        "title": title,
+        "url": url,
+        "date": date,
+        "excerpt": excerpt,
+        "source": source,
+        "keywords": keywords,
+        "is_theft_related": bool(keywords),
+        "is_business_related": business_related,
+        "detailed_location": ""
+    }
 
 def standardize_date(date_str: str) -> str:
     """
@@ -124,46 +177,50 @@ def standardize_date(date_str: str) -> str:
         Standardized date string in YYYY-MM-DD format
     """
     if not date_str:
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
         
     try:
         # Remove timezone information if present
         date_str = re.sub(r'\s*[A-Z]{3,4}$', '', date_str)
         
+        # strptime month names are case-insensitive, so match the cleanup
+        # patterns against lowercase text instead of using re.IGNORECASE
+        date_str = date_str.lower()
+        
         # Remove common prefixes in dates
-        date_str = re.sub(r'^(Published|Updated|Posted)\s*:\s*', '', date_str, flags=re.IGNORECASE)
+        date_str = re.sub(r'^(published|updated|posted)\s*:\s*', '', date_str)
         
         # Handle Review Journal format: "April 2, 2025 - 6:00 am"
-        date_str = re.sub(r'\s*-\s*\d+:\d+\s*(?:am|pm)', '', date_str, flags=re.IGNORECASE)
+        date_str = re.sub(r'\s*-\s*\d+:\d+\s*(?:am|pm)', '', date_str)
         
         # Try different date formats
-        formats = [
-            '%Y-%m-%d',
-            '%B %d, %Y',
-            '%B %d %Y',
-            '%b %d, %Y',
-            '%b %d %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%Y/%m/%d',
-            '%m/%d/%Y',
-            '%m/%d/%y'
-        ]
-        
-        for fmt in formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-                
+        parsed_date = parse_date(date_str, DATE_FORMATS)
+        if parsed_date is not None:
+            return parsed_date
+            
         # If no format matches, use current date
         logger.warning(f"Could not parse date: {date_str}")
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
         
     except Exception as e:
         logger.error(f"Error parsing date '{date_str}': {e}")
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
+
+# Common Las Vegas area location patterns, lowercase to match the lowercased content
+# without re.IGNORECASE
+_LOCATION_DETAIL_PATTERNS = [re.compile(pattern) for pattern in (
+    r'in\s+([\w\s-]+)\s+las\s+vegas',
+    r'in\s+([\w\s-]+)\s+henderson',
+    r'in\s+([\w\s-]+)\s+north\s+las\s+vegas',
+    r'on\s+([\w\s-]+)\s+boulevard',
+    r'on\s+([\w\s-]+)\s+blvd',
+    r'on\s+([\w\s-]+)\s+ave',
+    r'on\s+([\w\s-]+)\s+avenue',
+    r'at\s+([\w\s-]+)\s+casino',
+    r'at\s+([\w\s-]+)\s+resort',
+    r'at\s+([\w\s-]+)\s+hotel',
+    r'at\s+the\s+([\w\s-]+)'
+)]
 
 def extract_location_details(content: str) -> str:
     """
@@ -182,25 +239,10 @@ def extract_location_details(content: str) -> str:
     str
         Detailed location information or empty string if none found
     """
-    # Common Las Vegas area location patterns
-    patterns = [
-        r'in\s+([\w\s-]+)\s+Las\s+Vegas',
-        r'in\s+([\w\s-]+)\s+Henderson',
-        r'in\s+([\w\s-]+)\s+North\s+Las\s+Vegas',
-        r'on\s+([\w\s-]+)\s+Boulevard',
-        r'on\s+([\w\s-]+)\s+Blvd',
-        r'on\s+([\w\s-]+)\s+Ave',
-        r'on\s+([\w\s-]+)\s+Avenue',
-        r'at\s+([\w\s-]+)\s+Casino',
-        r'at\s+([\w\s-]+)\s+Resort',
-        r'at\s+([\w\s-]+)\s+Hotel',
-        r'at\s+the\s+([\w\s-]+)'
-    ]
-    
     content = content.lower()
     
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in _LOCATION_DETAIL_PATTERNS:
+        match = pattern.search(content)
         if match:
             return match.group(1).strip()
             
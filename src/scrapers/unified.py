@@ -23,8 +23,11 @@ Standard library imports
 import logging
 import os
 import csv
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 
 """
 Local application imports
@@ -35,10 +38,76 @@ from .reviewjournal.scraper import ReviewJournalScraper
 from .eightnews.scraper import EightNewsScraper
 from .nevadacurrent.scraper import NevadaCurrentScraper
 from .newsapi.scraper import NewsAPIScraper
+from .common.webdriver import chromedriver_path
 from ..database import get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Insert statement for scraped articles, with OR IGNORE to handle duplicates based on URL
+INSERT_ARTICLE_SQL = '''
+INSERT OR IGNORE INTO articles
+(scraper_name, location, title, article_date, url, excerpt,
+ source, keywords, is_theft_related, is_business_related,
+ store_type, business_name, detailed_location, scraped_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Position of the URL in the rows inserted with INSERT_ARTICLE_SQL
+ARTICLE_URL_INDEX = 4
+
+# Columns of the CSV exports, in the order rows are written by _write_csv_file
+CSV_FIELDNAMES = (
+    'location', 'title', 'date', 'url', 'excerpt',
+    'source', 'keywords', 'is_theft_related', 'is_business_related',
+    'store_type', 'business_name', 'detailed_location'
+)
+
+# Scrapers that may start a Chrome browser. They run one after another, so only
+# one browser is up at once; only the API scrapers run alongside them
+BROWSER_SCRAPERS = frozenset(("jsa", "wfaa", "reviewjournal", "eightnews", "nevadacurrent"))
+
+# Held by the browser scraper currently scraping, across every UnifiedScraper and
+# scrape_all() call, so a run never drives Chrome alongside a browser scraper
+# that an earlier run abandoned
+_browser_lock = threading.Lock()
+
+# Write buffer for CSV exports, so thousands of rows go out in a few large writes
+CSV_BUFFER_SIZE = 1 << 20
+
+# URLs per existence query, below SQLite's default limit of 999 bound parameters
+URL_LOOKUP_CHUNK_SIZE = 500
+
+class _ScraperRun:
+    """One scraper's part in a scrape_all() call, resolved through future"""
+
+    def __init__(self, name: str, scraper: Any) -> None:
+        self.name = name
+        self.scraper = scraper
+        self.future = Future()
+        # Set once the scraper starts or the run is resolved without starting it
+        self.started = threading.Event()
+        self.started_at: Optional[float] = None
+        self.future.add_done_callback(lambda future: self.started.set())
+
+    def run(self, deep_check: bool, max_deep_check: int) -> None:
+        """Scrape unless the run was cancelled, resolving future with the outcome"""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        self.started_at = time.monotonic()
+        self.started.set()
+        logger.info(f"Starting {self.name} scraper...")
+        try:
+            result = self.scraper.scrape(deep_check=deep_check, max_deep_check=max_deep_check)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+    def fail(self, error: Exception) -> None:
+        """Resolve a run that never started with error, unless it was cancelled"""
+        if self.future.set_running_or_notify_cancel():
+            self.future.set_exception(error)
+
 class UnifiedScraper:
     """
     Main orchestrator for all news source scrapers.
@@ -59,175 +128,359 @@ class UnifiedScraper:
     business types: jewelry stores, sports memorabilia stores, and luxury goods stores.
     """
 
-    def __init__(self) -> None:
-        """Initialize the unified scraper with all configured scrapers."""
-        self.scrapers = {
-            "jsa": JSAScraper(),
-            "wfaa": WFAAScraper(),
-            "reviewjournal": ReviewJournalScraper(),
-            "eightnews": EightNewsScraper(),
-            "nevadacurrent": NevadaCurrentScraper(),
-            "newsapi": NewsAPIScraper()
+    # Longest a scraper may run, from the moment it starts scraping, before
+    # scrape_all skips it; also the longest a browser scraper waits for the
+    # browser to be freed by one that timed out in an earlier run
+    SCRAPER_TIMEOUT_SECONDS = 300
+
+    def __init__(self, write_csv: Optional[bool] = None) -> None:
+        """
+        Initialize the unified scraper with all configured scrapers.
+
+        Args:
+            write_csv: Whether to also export results to CSV files when the database
+                save succeeds; defaults to the SCRAPER_WRITE_CSV environment variable
+        """
+        if write_csv is None:
+            write_csv = os.getenv('SCRAPER_WRITE_CSV', 'false').lower() in ('1', 'true', 'yes')
+        self.write_csv = write_csv
+
+        # Scrapers are constructed on first use, so a run limited to some
+        # sources never builds the others
+        self._scraper_classes = {
+            "jsa": JSAScraper,
+            "wfaa": WFAAScraper,
+            "reviewjournal": ReviewJournalScraper,
+            "eightnews": EightNewsScraper,
+            "nevadacurrent": NevadaCurrentScraper,
+            "newsapi": NewsAPIScraper
         }
-    
-    def scrape_all(self, deep_check: bool = True, max_deep_check: int = 20) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        self._scrapers = {}
+
+    @property
+    def scrapers(self) -> Dict[str, Any]:
+        """All configured scrapers by name, constructing any not yet built."""
+        for name in self._scraper_classes:
+            self.get_scraper(name)
+        return self._scrapers
+
+    @scrapers.setter
+    def scrapers(self, scrapers: Dict[str, Any]) -> None:
+        """Replace the configured scrapers with already constructed instances."""
+        self._scraper_classes = {name: type(scraper) for name, scraper in scrapers.items()}
+        self._scrapers = dict(scrapers)
+
+    def get_scraper(self, name: str) -> Any:
+        """
+        Return the scraper registered under name, constructing it on first use.
+
+        Args:
+            name: Scraper name, e.g. "jsa" or "newsapi"
+
+        Returns:
+            The scraper instance
+        """
+        scraper = self._scrapers.get(name)
+        if scraper is None:
+            scraper = self._scrapers[name] = self._scraper_classes[name]()
+        return scraper
+
+    def scrape_all(self, deep_check: bool = True, max_deep_check: int = 20,
+                   sources: Optional[List[str]] = None) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
         """
         Run all configured scrapers to collect crime-related articles.
 
         Args:
             deep_check: Whether to perform deep content validation on articles
             max_deep_check: Maximum number of articles to deep check per scraper
+            sources: Names of the scrapers to run; all configured scrapers if None
 
         Returns:
             Dict containing scraper names as keys and their results as values.
             Structure: {scraper_name: {location: [articles]}}
+
+        Raises:
+            ValueError: If sources names a scraper that is not configured
         """
         results = {}
-
-        for name, scraper in self.scrapers.items():
-            logger.info(f"Starting {name} scraper...")
+        names = list(self._scraper_classes) if sources is None else sources
+
+        # Reject unknown names before any scraper starts, rather than failing
+        # partway through with some scrapers already running
+        unknown = [name for name in names if name not in self._scraper_classes]
+        if unknown:
+            raise ValueError(f"Unknown scraper source(s): {', '.join(unknown)}")
+
+        # Resolve chromedriver before any scraper starts, so concurrent scrapers
+        # never race webdriver_manager's shared download. A failure here is only
+        # logged; scrapers that need the driver retry under the same lock
+        if BROWSER_SCRAPERS.intersection(names):
             try:
-                results[name] = scraper.scrape(deep_check=deep_check, max_deep_check=max_deep_check)
+                chromedriver_path()
+            except Exception as e:
+                logger.warning(f"Could not resolve chromedriver up front: {e}")
+
+        # Browser scrapers run one after another on a single thread, so only one
+        # browser is up at a time. The API scrapers are the only ones that run
+        # alongside them
+        runs = {name: _ScraperRun(name, self.get_scraper(name)) for name in names}
+        for name, run in runs.items():
+            if name not in BROWSER_SCRAPERS:
+                self._start_runs(f"{name}-scraper", [run], deep_check, max_deep_check)
+        browser_runs = [run for name, run in runs.items() if name in BROWSER_SCRAPERS]
+        if browser_runs:
+            self._start_runs("browser-scrapers", browser_runs, deep_check, max_deep_check, browser=True)
+
+        # Each scraper's timeout starts when it starts scraping, so browser
+        # scrapers waiting for their turn are not charged for the ones before
+        # them. Results are collected in scraper order so results, CSV files and
+        # summaries stay stable
+        for name, run in runs.items():
+            # A browser scraper starts once the one before it finishes or has
+            # been abandoned and everything behind it cancelled, so this ends
+            run.started.wait()
+            try:
+                if run.started_at is None:
+                    results[name] = run.future.result()
+                else:
+                    deadline = run.started_at + self.SCRAPER_TIMEOUT_SECONDS
+                    results[name] = run.future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.error(f"{name} scraper did not finish within {self.SCRAPER_TIMEOUT_SECONDS} seconds, skipping it")
+                self._abandon_scraper(name, run.future)
+                results[name] = {}
+                if name in BROWSER_SCRAPERS:
+                    # The abandoned scraper may still hold the browser, so the
+                    # browser scrapers queued behind it would never get a turn
+                    for queued in browser_runs:
+                        if queued.future.cancel():
+                            logger.error(f"Skipping {queued.name} scraper, the browser is still in use by {name}")
+            except CancelledError:
+                results[name] = {}
             except Exception as e:
                 logger.error(f"Error in {name} scraper: {e}")
                 results[name] = {}
 
-        # Save results to database and CSV files
+        # Save results to database and CSV files once every scraper has finished
+        # or timed out, keeping database writes on this thread
         self._save_results(results)
 
         return results
     
+    def _start_runs(self, thread_name: str, runs: List[_ScraperRun], deep_check: bool,
+                    max_deep_check: int, browser: bool = False) -> None:
+        """
+        Run scrapers one after another on a daemon thread.
+
+        A daemon thread never keeps the process alive, so a scraper that ignores
+        stop() cannot hang the interpreter at exit. Browser scrapers hold
+        _browser_lock for their whole scrape. If a scraper abandoned by an
+        earlier run keeps the lock past SCRAPER_TIMEOUT_SECONDS, the remaining
+        browser scrapers fail without starting. A run is only marked running
+        once its scraper starts, so a scraper still waiting for its turn can be
+        cancelled outright.
+
+        Args:
+            thread_name: Name of the thread running the scrapers
+            runs: Scraper runs, in the order they should scrape
+            deep_check: Whether to perform deep content validation on articles
+            max_deep_check: Maximum number of articles to deep check
+            browser: Whether the scrapers start a browser and need _browser_lock
+        """
+        def work() -> None:
+            for i, run in enumerate(runs):
+                if browser and not _browser_lock.acquire(timeout=self.SCRAPER_TIMEOUT_SECONDS):
+                    error = RuntimeError("the browser is still in use by a scraper that timed out")
+                    for waiting in runs[i:]:
+                        waiting.fail(error)
+                    return
+                try:
+                    run.run(deep_check, max_deep_check)
+                finally:
+                    if browser:
+                        _browser_lock.release()
+
+        threading.Thread(target=work, name=thread_name, daemon=True).start()
+    
+    def _abandon_scraper(self, name: str, future: Future) -> None:
+        """
+        Give up on a scraper that missed the deadline.
+
+        A scraper still waiting for its turn is cancelled before it starts.
+        A running scraper is asked to stop and dropped from the cache, so the
+        next scrape_all() starts a fresh instance instead of reusing one that
+        may still be busy or stopped.
+
+        Args:
+            name: Name of the scraper
+            future: Future of the scraper's run
+        """
+        if future.cancel():
+            return
+
+        scraper = self._scrapers.pop(name, None)
+        if scraper is not None:
+            scraper.stop()
+    
     def _save_results(self, results: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> None:
         """
-        Save scraping results to both database and CSV files.
+        Save scraping results to the database, and to CSV files when needed.
+
+        CSV files are written when the database save fails, as a backup, or when
+        CSV export was requested with write_csv.
 
         Args:
             results: Dictionary containing scraper results organized by scraper name and location
         """
-        # Create output directory if it doesn't exist
-        os.makedirs('output', exist_ok=True)
+        # One clock reading stamps both the database records and the CSV file names
+        now = datetime.now()
 
         # Try to save to database first
-        database_success = self._save_to_database(results)
+        database_success = self._save_to_database(results, now)
 
-        # Always save to CSV for backward compatibility
-        self._save_results_to_csv(results)
+        if not database_success or self.write_csv:
+            # Create output directory if it doesn't exist
+            os.makedirs('output', exist_ok=True)
+            self._save_results_to_csv(results, now)
 
         if not database_success:
             logger.warning("Database save failed, but CSV backup was created")
 
-    def _save_to_database(self, results: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> bool:
+    def _save_to_database(self, results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+                          now: Optional[datetime] = None) -> bool:
         """
         Save results to the SQLite database.
 
         Args:
             results: Dictionary containing scraper results
+            now: Time recorded as scraped_at; the current time if None
 
         Returns:
             bool: True if save was successful, False otherwise
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        articles_saved = 0
+        timestamp = (now or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+
+        # Build every row first so the inserts go to SQLite in one executemany call.
+        # Only the first article seen for a URL is kept, as INSERT OR IGNORE would
+        rows = []
+        batch_urls = set()
+        for scraper_name, location_articles in results.items():
+            if not location_articles:
+                continue
+
+            for location, articles in location_articles.items():
+                for article in articles:
+                    try:
+                        url = article['url']
+                        if url in batch_urls:
+                            continue
+
+                        get = article.get
+                        row = (
+                            scraper_name,
+                            location,
+                            article['title'],
+                            article['date'],  # Should be in ISO format YYYY-MM-DD
+                            url,
+                            article['excerpt'],
+                            article['source'],
+                            ','.join(get('keywords', [])),
+                            # Convert boolean flags to integers for SQLite
+                            1 if article['is_theft_related'] else 0,
+                            1 if article['is_business_related'] else 0,
+                            get('store_type', ''),
+                            get('business_name', ''),
+                            get('detailed_location', ''),
+                            timestamp
+                        )
+                    except Exception as e:
+                        logger.error(f"Error preparing article for insertion: {e}")
+                        continue
+
+                    batch_urls.add(url)
+                    rows.append(row)
 
         try:
             with get_db_connection() as conn:
                 cursor = conn.cursor()
 
-                for scraper_name, location_articles in results.items():
-                    if not location_articles:
-                        continue
+                # Take the write lock up front so the whole batch is one transaction
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Drop articles stored by earlier runs rather than sending them to
+                # SQLite only to be ignored
+                existing_urls = self._existing_urls(cursor, batch_urls)
+                rows = [row for row in rows if row[ARTICLE_URL_INDEX] not in existing_urls]
 
-                    for location, articles in location_articles.items():
-                        for article in articles:
-                            success = self._insert_article(cursor, scraper_name, location, article, timestamp)
-                            if success:
-                                articles_saved += 1
+                cursor.executemany(INSERT_ARTICLE_SQL, rows)
+                articles_saved = cursor.rowcount
 
                 # Commit all insertions at once
                 conn.commit()
 
-            logger.info(f"Saved {articles_saved} articles to database")
+            logger.info(f"Saved {articles_saved} new articles to database")
             return True
 
         except Exception as e:
             logger.error(f"Error saving to database: {e}")
             return False
 
-    def _insert_article(self, cursor: Any, scraper_name: str, location: str,
-                       article: Dict[str, Any], timestamp: str) -> bool:
+    def _existing_urls(self, cursor: Any, urls: Set[str]) -> Set[str]:
         """
-        Insert a single article into the database.
+        Find which of the given URLs are already stored in the articles table.
+
+        Looks up only this run's URLs through the unique index on url, so memory
+        and work scale with the batch rather than with the size of the table.
 
         Args:
             cursor: Database cursor
-            scraper_name: Name of the scraper that found this article
-            location: Location associated with the article
-            article: Article data dictionary
-            timestamp: Timestamp for the record
+            urls: URLs to look up
 
         Returns:
-            bool: True if insertion was successful, False otherwise
+            Set[str]: The subset of urls already present in the database
         """
-        try:
-            # Convert boolean flags to integers for SQLite
-            is_theft_related = 1 if article['is_theft_related'] else 0
-            is_business_related = 1 if article['is_business_related'] else 0
-
-            # Prepare article data for insertion
-            article_data = (
-                scraper_name,
-                location,
-                article['title'],
-                article['date'],  # Should be in ISO format YYYY-MM-DD
-                article['url'],
-                article['excerpt'],
-                article['source'],
-                ','.join(article['keywords']),
-                is_theft_related,
-                is_business_related,
-                article.get('store_type', ''),
-                article.get('business_name', ''),
-                article.get('detailed_location', ''),
-                timestamp
-            )
-
-            # SQL statement with OR IGNORE to handle duplicates based on URL
-            sql = '''
-            INSERT OR IGNORE INTO articles
-            (scraper_name, location, title, article_date, url, excerpt,
-             source, keywords, is_theft_related, is_business_related,
-             store_type, business_name, detailed_location, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            '''
-
-            cursor.execute(sql, article_data)
-            return True
-
-        except Exception as e:
-            logger.error(f"Error inserting article: {e}")
-            return False
-            
-    def _save_results_to_csv(self, results: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> None:
+        existing = set()
+        batch = list(urls)
+        for start in range(0, len(batch), URL_LOOKUP_CHUNK_SIZE):
+            chunk = batch[start:start + URL_LOOKUP_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", chunk)
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+
+    def _save_results_to_csv(self, results: Dict[str, Dict[str, List[Dict[str, Any]]]],
+                             now: Optional[datetime] = None) -> None:
         """
         Save results to CSV files for backward compatibility.
 
         Args:
             results: Dictionary containing scraper results
+            now: Time used in the file names; the current time if None
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        for scraper_name, location_articles in results.items():
-            if not location_articles:
-                continue
-
-            # Create CSV file for this scraper
-            output_file = f'output/{scraper_name}_articles_{timestamp}.csv'
-
-            try:
-                self._write_csv_file(output_file, location_articles)
-                logger.info(f"Results saved to CSV: {output_file}")
-            except Exception as e:
-                logger.error(f"Error saving CSV file {output_file}: {e}")
+        timestamp = (now or datetime.now()).strftime('%Y%m%d_%H%M%S')
+
+        # Create one CSV file per scraper; the files are independent, so they are
+        # written concurrently
+        outputs = {
+            f'output/{scraper_name}_articles_{timestamp}.csv': location_articles
+            for scraper_name, location_articles in results.items()
+            if location_articles
+        }
+        if not outputs:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            futures = {
+                output_file: executor.submit(self._write_csv_file, output_file, location_articles)
+                for output_file, location_articles in outputs.items()
+            }
+
+            for output_file, future in futures.items():
+                try:
+                    future.result()
+                    logger.info(f"Results saved to CSV: {output_file}")
+                except Exception as e:
+                    logger.error(f"Error saving CSV file {output_file}: {e}")
 
     def _write_csv_file(self, output_file: str, location_articles: Dict[str, List[Dict[str, Any]]]) -> None:
         """
@@ -237,33 +490,29 @@ class UnifiedScraper:
             output_file: Path to the output CSV file
             location_articles: Dictionary of articles organized by location
         """
-        fieldnames = [
-            'location', 'title', 'date', 'url', 'excerpt',
-            'source', 'keywords', 'is_theft_related', 'is_business_related',
-            'store_type', 'business_name', 'detailed_location'
-        ]
-
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for location, articles in location_articles.items():
-                for article in articles:
-                    row = {
-                        'location': location,
-                        'title': article['title'],
-                        'date': article['date'],
-                        'url': article['url'],
-                        'excerpt': article['excerpt'],
-                        'source': article['source'],
-                        'keywords': ','.join(article['keywords']),
-                        'is_theft_related': article['is_theft_related'],
-                        'is_business_related': article['is_business_related'],
-                        'store_type': article.get('store_type', ''),
-                        'business_name': article.get('business_name', ''),
-                        'detailed_location': article.get('detailed_location', '')
-                    }
-                    writer.writerow(row)
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+
+            # Write every row in one call instead of a DictWriter row at a time
+            writer.writerows(
+                (
+                    location,
+                    article['title'],
+                    article['date'],
+                    article['url'],
+                    article['excerpt'],
+                    article['source'],
+                    ','.join(article.get('keywords', [])),
+                    article['is_theft_related'],
+                    article['is_business_related'],
+                    article.get('store_type', ''),
+                    article.get('business_name', ''),
+                    article.get('detailed_location', '')
+                )
+                for location, articles in location_articles.items()
+                for article in articles
+            )
 
 def main() -> None:
     """
@@ -323,7 +572,7 @@ def _display_results_summary(results: Dict[str, Dict[str, List[Dict[str, Any]]]]
                     print(f"    ... and {len(articles) - 3} more articles")
 
     print(f"\n🎯 Total articles collected: {total_articles}")
-    print("📊 Results saved to database and CSV files in output/ directory")
+    print("📊 Results saved to database (CSV files in output/ directory when enabled)")
 
 
 if __name__ == "__main__":
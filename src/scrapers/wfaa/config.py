@@ -7,6 +7,8 @@ from ..jsa.config import MONITORED_LOCATIONS, LOCATION_VARIATIONS
 WFAA_CONFIG = {
     "name": "WFAA Crime News",
     "url": "https://www.wfaa.com/section/crime",
+    # Idle WebDrivers kept alive for reuse by later scrapes in the same process
+    "driver_pool_size": 2,
     "selectors": {
         "posts": [
             ".grid__module",
@@ -7,36 +7,75 @@ extracting theft incidents and related information.
 
 import time
 import re
-import requests
 import os
-from typing import Dict, List, Optional
+import soupsieve
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
 from ..base import BaseScraper, Article
+from ..common.webdriver import (
+    DriverPool, PooledDriverMixin, chrome_user_data_dir, chromedriver_path, http_session
+)
 from .config import WFAA_CONFIG, MONITORED_LOCATIONS
-from .utils import detect_location, extract_keywords, is_business_related, standardize_date, extract_location_details
+from .utils import analyze_text, detect_location, standardize_date, extract_location_details
 from src.utils.logger import get_logger
 from src.utils.exceptions import ScraperNetworkError, ScraperParsingError
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
-class WFAAScraper(BaseScraper):
+# Requests Chrome never needs to make: BeautifulSoup only reads the HTML, so
+# images, video, fonts and ad/analytics traffic are blocked. Stylesheets still
+# load since scroll_to_load_more relies on the laid-out page height
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.mp4",
+    "*.woff", "*.woff2", "*.ttf", "*/analytics*", "*doubleclick*"
+]
+
+@lru_cache(maxsize=None)
+def _compile_selectors(selectors: Tuple[str, ...]) -> List[soupsieve.SoupSieve]:
+    """Compile a configured selector list into CSS selectors once, skipping invalid ones"""
+    compiled = []
+    for selector in selectors:
+        try:
+            compiled.append(soupsieve.compile(selector))
+        except soupsieve.SelectorSyntaxError as e:
+            logger.warning(f"Skipping invalid selector {selector}: {str(e)}")
+    return compiled
+
+# Serializes the rendered <body> without the scripts, styles, inline SVG and
+# iframes BeautifulSoup never reads, so far less HTML crosses the WebDriver
+# connection than with page_source. Works on a copy so the live page is untouched
+PAGE_CONTENT_SCRIPT = """
+const body = document.body.cloneNode(true);
+body.querySelectorAll('script, style, noscript, svg, iframe').forEach(element => element.remove());
+return body.outerHTML;
+"""
+
+class WFAAScraper(PooledDriverMixin, BaseScraper):
     """Selenium-based WFAA scraper implementation"""
     
+    # Idle drivers shared by every scraper instance so a browser is started at
+    # most once per pooled slot rather than once per scrape
+    _driver_pool = DriverPool(WFAA_CONFIG["driver_pool_size"])
+    
     def __init__(self):
         super().__init__(WFAA_CONFIG["name"], WFAA_CONFIG["url"])
         self.config = WFAA_CONFIG
         self.monitored_locations = MONITORED_LOCATIONS
         self.driver = None
+        
+        # Set when the current driver hit a navigation or script error; such a
+        # driver is quit instead of being returned to the pool
+        self._driver_dirty = False
     
     def setup_driver(self):
         """Set up and return a configured Chrome/Chromium WebDriver"""
@@ -51,6 +90,13 @@ class WFAAScraper(BaseScraper):
         chrome_options.add_argument('--disable-extensions')
         chrome_options.add_argument('--disable-software-rasterizer')
         
+        # Only the HTML is needed, so skip images; fonts and media are blocked
+        # once the driver is up, see _block_heavy_resources
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2
+        })
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        
         # Create the driver with retry logic
         max_retries = 3
         for attempt in range(max_retries):
@@ -62,24 +108,22 @@ class WFAAScraper(BaseScraper):
                     logger.info("Attempting to use Chromium directly")
                     chrome_options.binary_location = "/usr/bin/chromium-browser"
                     # Add a unique user data directory to avoid conflicts
-                    import tempfile
-                    import uuid
-                    temp_dir = tempfile.mkdtemp(prefix="chromium_data_")
-                    unique_id = str(uuid.uuid4())
-                    user_data_dir = os.path.join(temp_dir, unique_id)
+                    user_data_dir = chrome_user_data_dir()
                     chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
                     logger.info(f"Using temporary user data directory: {user_data_dir}")
                     self.driver = webdriver.Chrome(options=chrome_options)
                     self.driver.set_page_load_timeout(30)
+                    self._block_heavy_resources()
                     return self.driver
                 except Exception as chromium_error:
                     logger.warning(f"Could not use Chromium directly: {str(chromium_error)}")
                     
                     # Fall back to webdriver_manager approach
                     logger.info("Falling back to webdriver_manager")
-                    service = Service(ChromeDriverManager().install())
+                    service = Service(chromedriver_path())
                     self.driver = webdriver.Chrome(service=service, options=chrome_options)
                     self.driver.set_page_load_timeout(30)
+                    self._block_heavy_resources()
                     return self.driver
                 
             except Exception as e:
@@ -96,6 +140,14 @@ class WFAAScraper(BaseScraper):
         logger.error("Failed to create WebDriver after all retries")
         return None
     
+    def _block_heavy_resources(self):
+        """Block BLOCKED_URL_PATTERNS in the current driver through the DevTools protocol"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block resource loading: {str(e)}")
+    
     def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a page with retry logic and better timeout handling"""
         max_retries = 3
@@ -103,9 +155,13 @@ class WFAAScraper(BaseScraper):
             try:
                 logger.info(f"Attempting to fetch page with Selenium (attempt {attempt + 1}/{max_retries}): {url}")
                 
+                # Replace a driver that failed on an earlier attempt
+                if self.driver and self._driver_dirty:
+                    self._release_driver()
+                    
                 # Ensure we have a driver
                 if not self.driver:
-                    self.setup_driver()
+                    self._acquire_driver()
                 
                 # If still no driver, use requests as fallback
                 if not self.driver:
@@ -146,6 +202,7 @@ class WFAAScraper(BaseScraper):
                 
             except Exception as e:
                 logger.error(f"Error fetching page (attempt {attempt + 1}): {str(e)}")
+                self._driver_dirty = True
                 if attempt < max_retries - 1:
                     time.sleep(2)  # Short delay before retry
                 continue
@@ -155,22 +212,18 @@ class WFAAScraper(BaseScraper):
         return self._fetch_with_requests(url)
     
     def _fetch_with_requests(self, url: str) -> Optional[str]:
-        """Fallback method to fetch page with requests if Selenium fails"""
+        """Fallback method to fetch page with the shared requests session if Selenium fails"""
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempting to fetch page with requests (attempt {attempt + 1}/{max_retries}): {url}")
                 
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                }
-                
-                response = requests.get(url, headers=headers, timeout=15)
+                response = http_session.get(url, timeout=15)
                 
                 if response.status_code == 200:
-                    page_content = response.text
+                    # Decode with the declared charset, defaulting to UTF-8, instead of
+                    # letting response.text run charset detection over the page
+                    page_content = response.content.decode(response.encoding or 'utf-8', errors='replace')
                     
                     if not page_content or len(page_content.strip()) < 100:
                         logger.warning("Page content from requests is empty or too short")
@@ -194,63 +247,17 @@ class WFAAScraper(BaseScraper):
         if isinstance(selectors, str):
             selectors = [selectors]
             
-        for selector in selectors:
+        # Class, attribute and tag selectors are all plain CSS, compiled once per list
+        for selector in _compile_selectors(tuple(selectors)):
             try:
-                if selector.startswith('.'):
-                    # Class selector
-                    element = container.find(class_=selector[1:])
-                elif selector.startswith('[') and selector.endswith(']'):
-                    # Attribute selector like [data-module]
-                    attr_name = selector[1:-1]
-                    elements = container.find_all(attrs={attr_name: True})
-                    element = elements[0] if elements else None
-                else:
-                    # Tag selector
-                    element = container.find(selector)
+                element = selector.select_one(container)
                 if element:
                     return element
             except Exception as e:
-                logger.debug(f"Error finding element with selector {selector}: {str(e)}")
+                logger.debug(f"Error finding element with selector {selector.pattern}: {str(e)}")
                 continue
         return None
     
-    def scroll_to_load_more(self, max_scrolls=10):
-        """
-        Scroll down the page to load more dynamically loaded content
-        
-        Parameters:
-        -----------
-        max_scrolls : int
-            Maximum number of scroll operations to perform
-        """
-        try:
-            if not self.driver:
-                logger.warning("No driver available for scrolling")
-                return
-                
-            logger.info(f"Starting scroll operation to load more content (max: {max_scrolls})")
-            initial_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            for i in range(max_scrolls):
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                # Wait for content to load
-                time.sleep(2)
-                
-                # Calculate new scroll height and compare to last scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == initial_height:
-                    # No new content loaded, stop scrolling
-                    logger.info(f"No new content after scroll {i+1}, stopping")
-                    break
-                    
-                initial_height = new_height
-                logger.info(f"Completed scroll {i+1}/{max_scrolls}, new height: {new_height}")
-                
-        except Exception as e:
-            logger.error(f"Error during scroll operation: {str(e)}")
-    
     def scrape_crime_news(self, max_scrolls: int = 5) -> Dict[str, List[Dict]]:
         """
         Scrape crime news from WFAA
@@ -276,8 +283,8 @@ class WFAAScraper(BaseScraper):
         location_articles["Other"] = []
         
         try:
-            # Set up the driver
-            self.setup_driver()
+            # Take a pooled driver, or set one up
+            self._acquire_driver()
             
             # Get the first page
             current_url = self.config["url"]
@@ -285,32 +292,31 @@ class WFAAScraper(BaseScraper):
             
             if not page_content:
                 logger.error("Failed to get the crime page")
-                
-                # Try the section crime URL as fallback
-                logger.info("Trying alternative crime section URL")
-                current_url = "https://www.wfaa.com/section/crime"
-                page_content = self.fetch_page(current_url)
-                
-                if not page_content:
-                    logger.error("Failed to get the crime section page")
-                    return location_articles
+                return location_articles
                 
             # Use Selenium to scroll and load more content if dynamic loading is detected
             self.scroll_to_load_more(max_scrolls=max_scrolls)
             
             # Get the updated page content after scrolling
-            page_content = self.driver.page_source
-            soup = BeautifulSoup(page_content, 'html.parser')
+            page_content = self.driver.execute_script(PAGE_CONTENT_SCRIPT) or self.driver.page_source
+            soup = BeautifulSoup(page_content, 'lxml')
             
             # Find all post/article sections using multiple selectors
             posts = []
+            seen_posts = set()
             for selector in self.config["selectors"]["posts"]:
                 if selector.startswith('.'):
                     # Class selector
-                    posts.extend(soup.find_all(class_=selector[1:]))
+                    matches = soup.find_all(class_=selector[1:])
                 else:
                     # Tag selector
-                    posts.extend(soup.find_all(selector))
+                    matches = soup.find_all(selector)
+                    
+                # An element matched by several selectors is only processed once
+                for post in matches:
+                    if id(post) not in seen_posts:
+                        seen_posts.add(id(post))
+                        posts.append(post)
             
             if not posts:
                 logger.warning("No post sections found on the page")
@@ -338,8 +344,8 @@ class WFAAScraper(BaseScraper):
                     if not title:
                         continue
                     
-                    # Log the title for debugging
-                    logger.info(f"Found article title: {title}")
+                    # Log the title for debugging; formatted only if debug logging is on
+                    logger.debug("Found article title: %s", title)
                         
                     # Get URL - first try the heading link, then any link
                     url = ""
@@ -374,20 +380,18 @@ class WFAAScraper(BaseScraper):
                     # If no excerpt, try to use the title as content
                     content_to_check = f"{title} {excerpt}".lower() if excerpt else title.lower()
                     
-                    # Extract keywords and check if business related
-                    keywords = extract_keywords(content_to_check)
-                    business_related = is_business_related(content_to_check)
+                    # Extract keywords and check if business related from the one lowercase copy
+                    keywords, business_related = analyze_text(content_to_check, already_lower=True)
                     
                     # Log details for monitoring
-                    logger.info(f"Article keywords: {keywords}")
-                    logger.info(f"Business related: {business_related}")
+                    logger.debug("Article keywords: %s, business related: %s", keywords, business_related)
                     
                     # Only include articles that are theft-related or business-related
                     if not keywords and not business_related:
                         continue
                         
                     # Try to extract more detailed location
-                    detailed_location = extract_location_details(content_to_check)
+                    detailed_location = extract_location_details(content_to_check, already_lower=True)
                     
                     # Create article object
                     article_obj = {
@@ -403,7 +407,7 @@ class WFAAScraper(BaseScraper):
                     }
                     
                     # Detect location and add to appropriate list
-                    location = detect_location(content_to_check)
+                    location = detect_location(content_to_check, already_lower=True)
                     if location in location_articles:
                         location_articles[location].append(article_obj)
                         article_count += 1
@@ -411,7 +415,7 @@ class WFAAScraper(BaseScraper):
                         location_articles["Other"].append(article_obj)
                         article_count += 1
                         
-                    logger.info(f"Processed article: {title}")
+                    logger.debug("Processed article: %s", title)
                         
                 except Exception as e:
                     logger.error(f"Error processing article: {e}")
@@ -425,11 +429,8 @@ class WFAAScraper(BaseScraper):
             return location_articles
             
         finally:
-            if self.driver:
-                try:
-                    self.driver.quit()
-                except:
-                    pass
+            # Keep the browser alive for the next scrape instead of quitting it
+            self._release_driver()
     
     def scrape(self, deep_check: bool = True, max_deep_check: int = 20) -> Dict[str, List[Dict]]:
         """
@@ -482,28 +483,30 @@ def main():
     # Write results to CSV
     try:
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
+            writer = csv.writer(f)
+            writer.writerow([
                 'location', 'title', 'date', 'url', 'excerpt',
                 'source', 'keywords', 'is_theft_related', 'is_business_related',
                 'detailed_location'
             ])
-            writer.writeheader()
             
-            for location, articles in results.items():
-                for article in articles:
-                    row = {
-                        'location': location,
-                        'title': article['title'],
-                        'date': article['date'],
-                        'url': article['url'],
-                        'excerpt': article['excerpt'],
-                        'source': article['source'],
-                        'keywords': ','.join(article['keywords']),
-                        'is_theft_related': article['is_theft_related'],
-                        'is_business_related': article['is_business_related'],
-                        'detailed_location': article.get('detailed_location', '')
-                    }
-                    writer.writerow(row)
+            # Write every row in one call instead of a DictWriter row at a time
+            writer.writerows(
+                (
+                    location,
+                    article['title'],
+                    article['date'],
+                    article['url'],
+                    article['excerpt'],
+                    article['source'],
+                    ','.join(article['keywords']),
+                    article['is_theft_related'],
+                    article['is_business_related'],
+                    article.get('detailed_location', '')
+                )
+                for location, articles in results.items()
+                for article in articles
+            )
         
         main_logger.info(f"Results saved to {output_file}")
         
@@ -10,13 +10,41 @@ This module provides specialized functions for processing WFAA crime news:
 
 import re
 import logging
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Tuple
+from ..common.text_filters import (
+    make_keyword_extractor, make_keyword_matcher, make_location_detector, make_text_analyzer, parse_date, today
+)
 from .config import LOCATION_VARIATIONS, THEFT_KEYWORDS, BUSINESS_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
-def detect_location(content: str) -> Optional[str]:
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%B %d, %Y',
+    '%B %d %Y',
+    '%b %d, %Y',
+    '%b %d %Y',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%m/%d/%y',  # MM/DD/YY format
+    '%I:%M %p %m/%d/%Y'  # WFAA's "12:34 PM 4/1/2025" format
+)
+
+# Keyword lists and location variations are compiled once at import instead of
+# a regex search per keyword or variation. Texas is checked before any other
+# location since WFAA is a Texas news source
+_detect_location = make_location_detector(LOCATION_VARIATIONS, preferred="Texas")
+_extract_keywords = make_keyword_extractor(THEFT_KEYWORDS)
+_is_business_related = make_keyword_matcher(BUSINESS_KEYWORDS)
+_analyze_text = make_text_analyzer(THEFT_KEYWORDS, BUSINESS_KEYWORDS)
+
+# Timezone suffixes and "Published:"-style prefixes stripped from WFAA dates
+_TIMEZONE_SUFFIX_PATTERN = re.compile(r'\s*[A-Z]{3,4}$')
+_DATE_PREFIX_PATTERN = re.compile(r'^(Published|Updated|Posted)\s*:\s*', re.IGNORECASE)
+
+def detect_location(content: str, already_lower: bool = False) -> Optional[str]:
     """
     Detect location from content, with enhanced focus on Texas cities.
     
@@ -27,37 +55,17 @@ def detect_location(content: str) -> Optional[str]:
     -----------
     content : str
         Content to analyze for location mentions
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
         
     Returns:
     --------
     Optional[str]
         Detected location or None if no location found
     """
-    content = content.lower()
-    
-    # First try to find Texas-specific matches since WFAA is a Texas news source
-    texas_variations = LOCATION_VARIATIONS.get("Texas", [])
-    if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in texas_variations):
-        return "Texas"
-    
-    # Then check other locations
-    for location, variations in LOCATION_VARIATIONS.items():
-        if location == "Texas":  # Already checked
-            continue
-            
-        # Check state name and abbreviation first
-        state_variations = [variations[0], variations[1]]  # State name and abbreviation
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in state_variations):
-            return location
-            
-        # Then check cities
-        city_variations = variations[2:]  # All other variations are cities
-        if any(re.search(r'\b' + re.escape(v.lower()) + r'\b', content) for v in city_variations):
-            return location
-                
-    return None
+    return _detect_location(content, already_lower=already_lower)
 
-def extract_keywords(content: str) -> List[str]:
+def extract_keywords(content: str, already_lower: bool = False) -> List[str]:
     """
     Extract theft-related keywords to qualify leads and determine product needs.
     
@@ -67,23 +75,17 @@ def extract_keywords(content: str) -> List[str]:
     -----------
     content : str
         Content to analyze for keywords
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
         
     Returns:
     --------
     List[str]
         List of found keywords indicating specific security needs
     """
-    content = content.lower()
-    keywords = []
-    
-    # Check theft keywords
-    for keyword in THEFT_KEYWORDS:
-        if re.search(r'\b' + re.escape(keyword) + r'\b', content):
-            keywords.append(keyword)
-            
-    return keywords
+    return _extract_keywords(content, already_lower=already_lower)
 
-def is_business_related(content: str) -> bool:
+def is_business_related(content: str, already_lower: bool = False) -> bool:
     """
     Filter for B2B sales opportunities by identifying business-related incidents.
     
@@ -93,14 +95,33 @@ def is_business_related(content: str) -> bool:
     -----------
     content : str
         Content to analyze for business relevance
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
         
     Returns:
     --------
     bool
         True if content contains business keywords indicating sales opportunity
     """
-    content = content.lower()
-    return any(re.search(r'\b' + re.escape(keyword) + r'\b', content) for keyword in BUSINESS_KEYWORDS)
+    return _is_business_related(content, already_lower=already_lower)
+
+def analyze_text(content: str, already_lower: bool = False) -> Tuple[List[str], bool]:
+    """
+    Extract theft keywords and check business relevance with one lowercase copy.
+    
+    Parameters:
+    -----------
+    content : str
+        Content to analyze
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
+        
+    Returns:
+    --------
+    Tuple[List[str], bool]
+        Found theft keywords and whether the content is business related
+    """
+    return _analyze_text(content, already_lower=already_lower)
 
 def standardize_date(date_str: str) -> str:
     """
@@ -119,46 +140,55 @@ def standardize_date(date_str: str) -> str:
         Standardized date string in YYYY-MM-DD format
     """
     if not date_str:
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
         
     try:
         # Remove timezone information if present
-        date_str = re.sub(r'\s*[A-Z]{3,4}$', '', date_str)
+        date_str = _TIMEZONE_SUFFIX_PATTERN.sub('', date_str)
         
         # Remove common prefixes in WFAA dates
-        date_str = re.sub(r'^(Published|Updated|Posted)\s*:\s*', '', date_str, flags=re.IGNORECASE)
-        
-        # Try different date formats
-        formats = [
-            '%Y-%m-%d',
-            '%B %d, %Y',
-            '%B %d %Y',
-            '%b %d, %Y',
-            '%b %d %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%Y/%m/%d',
-            '%m/%d/%Y',
-            '%m/%d/%y',  # Added for MM/DD/YY format
-            '%I:%M %p %m/%d/%Y'  # Added for WFAA's "12:34 PM 4/1/2025" format
-        ]
+        date_str = _DATE_PREFIX_PATTERN.sub('', date_str)
         
-        for fmt in formats:
-            try:
-                parsed_date = datetime.strptime(date_str.strip(), fmt)
-                return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
-                continue
-                
+        # Try different date formats; results are cached per date string
+        parsed_date = parse_date(date_str, DATE_FORMATS)
+        if parsed_date is not None:
+            return parsed_date
+            
         # If no format matches, use current date
         logger.warning(f"Could not parse date: {date_str}")
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
         
     except Exception as e:
         logger.error(f"Error parsing date '{date_str}': {e}")
-        return datetime.now().strftime('%Y-%m-%d')
+        return today()
+
+# Common Dallas-Fort Worth area location patterns, lowercase to match the
+# lowercased content without re.IGNORECASE
+_LOCATION_DETAIL_PATTERNS = [re.compile(pattern) for pattern in (
+    r'in\s+([\w\s-]+)\s+dallas',
+    r'in\s+([\w\s-]+)\s+fort\s+worth',
+    r'in\s+([\w\s-]+)\s+arlington',
+    r'in\s+([\w\s-]+)\s+plano',
+    r'in\s+([\w\s-]+)\s+irving',
+    r'on\s+([\w\s-]+)\s+street',
+    r'on\s+([\w\s-]+)\s+road',
+    r'on\s+([\w\s-]+)\s+boulevard',
+    r'on\s+([\w\s-]+)\s+blvd',
+    r'on\s+([\w\s-]+)\s+ave',
+    r'on\s+([\w\s-]+)\s+avenue',
+    r'at\s+([\w\s-]+)\s+mall',
+    r'at\s+([\w\s-]+)\s+shopping\s+center'
+)]
+
+# Every detail pattern ends with one of these place words, so content without
+# any of them is rejected in one scan instead of a search per pattern. A single
+# alternation of the patterns themselves would return the leftmost match rather
+# than the first pattern in order that matches
+_LOCATION_DETAIL_SUFFIX_PATTERN = re.compile(
+    r'\s(?:dallas|fort\s+worth|arlington|plano|irving|street|road|boulevard|blvd|ave|avenue|mall|shopping\s+center)'
+)
 
-def extract_location_details(content: str) -> str:
+def extract_location_details(content: str, already_lower: bool = False) -> str:
     """
     Extract more detailed location information from content.
     
@@ -169,33 +199,22 @@ def extract_location_details(content: str) -> str:
     -----------
     content : str
         Content to analyze for location details
+    already_lower : bool
+        Whether content is already lowercased, skipping a redundant copy
         
     Returns:
     --------
     str
         Detailed location information or empty string if none found
     """
-    # Common Dallas-Fort Worth area location patterns
-    patterns = [
-        r'in\s+([\w\s-]+)\s+Dallas',
-        r'in\s+([\w\s-]+)\s+Fort\s+Worth',
-        r'in\s+([\w\s-]+)\s+Arlington',
-        r'in\s+([\w\s-]+)\s+Plano',
-        r'in\s+([\w\s-]+)\s+Irving',
-        r'on\s+([\w\s-]+)\s+Street',
-        r'on\s+([\w\s-]+)\s+Road',
-        r'on\s+([\w\s-]+)\s+Boulevard',
-        r'on\s+([\w\s-]+)\s+Blvd',
-        r'on\s+([\w\s-]+)\s+Ave',
-        r'on\s+([\w\s-]+)\s+Avenue',
-        r'at\s+([\w\s-]+)\s+Mall',
-        r'at\s+([\w\s-]+)\s+Shopping\s+Center'
-    ]
+    if not already_lower:
+        content = content.lower()
     
-    content = content.lower()
+    if not _LOCATION_DETAIL_SUFFIX_PATTERN.search(content):
+        return ""
     
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in _LOCATION_DETAIL_PATTERNS:
+        match = pattern.search(content)
         if match:
             return match.group(1).strip()
             
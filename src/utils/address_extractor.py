@@ -10,8 +10,8 @@ from typing import Optional, Dict, List, Tuple
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Common address patterns
-ADDRESS_PATTERNS = [
+# Common address patterns, compiled once at import
+ADDRESS_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
     # Street number + street name + city/state
     r'(\d+\s+[A-Za-z0-9\s\.]+(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr|Lane|Ln|Way|Court|Ct|Plaza|Plz|Square|Sq|Highway|Hwy|Parkway|Pkwy|Terrace|Ter|Place|Pl)\.?(?:\s+[A-Za-z]+)?(?:\s*,\s*[A-Za-z\s]+,\s*[A-Z]{2}))',
     
@@ -24,7 +24,53 @@ ADDRESS_PATTERNS = [
     
     # Address in parentheses
     r'\(([^()]*\d+[^()]*(?:Street|St|Avenue|Ave|Boulevard|Blvd|Road|Rd|Drive|Dr|Lane|Ln|Way|Court|Ct|Plaza|Plz|Square|Sq|Highway|Hwy|Parkway|Pkwy|Terrace|Ter|Place|Pl)[^()]*)\)',
-]
+)]
+
+# Text each address pattern needs before it can match, in the same order. A hint
+# is a single linear scan, while a failing pattern can backtrack heavily: the
+# business name pattern retries its name run from every position in the text
+ADDRESS_PATTERN_HINTS = [re.compile(hint, re.IGNORECASE) for hint in (
+    r'\d\s',
+    r'located\s+at\s',
+    r'address\s+(?:of|at|is|was)\s',
+    r'\sat\s+\d+\s',
+    r'\(',
+)]
+
+# Runs of whitespace collapsed to a single space in extracted addresses
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Street type abbreviations expanded by normalize_address, matched as whole
+# words in a single scan
+STREET_ABBREVIATIONS = {
+    'St': 'Street',
+    'Ave': 'Avenue',
+    'Blvd': 'Boulevard',
+    'Rd': 'Road',
+    'Dr': 'Drive',
+    'Ln': 'Lane',
+    'Ct': 'Court',
+    'Pkwy': 'Parkway',
+    'Hwy': 'Highway',
+    'Sq': 'Square',
+    'Pl': 'Place',
+    'Ter': 'Terrace',
+}
+STREET_ABBREVIATION_PATTERN = re.compile(r'\b(?:' + '|'.join(STREET_ABBREVIATIONS) + r')\b')
+
+# Parenthetical notes and comma spacing cleaned up by normalize_address
+PARENTHETICAL_PATTERN = re.compile(r'\s*\([^)]*\)')
+COMMA_PATTERN = re.compile(r'\s*,\s*')
+
+# Street types accepted by is_valid_address, matched as whole words in a single scan
+STREET_TYPES = ['street', 'st', 'avenue', 'ave', 'boulevard', 'blvd', 'road', 'rd',
+                'drive', 'dr', 'lane', 'ln', 'way', 'court', 'ct', 'plaza', 'plz',
+                'square', 'sq', 'highway', 'hwy', 'parkway', 'pkwy', 'terrace', 'ter', 'place', 'pl']
+STREET_TYPE_PATTERN = re.compile(r'\b(?:' + '|'.join(STREET_TYPES) + r')\b', re.IGNORECASE)
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Article fields searched for an address, in order
+ARTICLE_TEXT_FIELDS = ('excerpt', 'title', 'content', 'description')
 
 def extract_address_from_text(text: str) -> Optional[str]:
     """
@@ -39,20 +85,24 @@ def extract_address_from_text(text: str) -> Optional[str]:
     if not text:
         return None
         
-    # Try each pattern
-    for pattern in ADDRESS_PATTERNS:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if matches:
-            # Take the first match
-            if isinstance(matches[0], tuple):
-                # If the match is a tuple (multiple capture groups), join them
-                address = ' at '.join(part for part in matches[0] if part)
+    # Try each pattern whose hint occurs in the text
+    for hint, pattern in zip(ADDRESS_PATTERN_HINTS, ADDRESS_PATTERNS):
+        if not hint.search(text):
+            continue
+            
+        # Only the first match is used, so stop scanning once it is found
+        match = pattern.search(text)
+        if match:
+            groups = match.groups()
+            if len(groups) > 1:
+                # If the match has multiple capture groups, join them
+                address = ' at '.join(part for part in groups if part)
             else:
-                address = matches[0]
+                address = groups[0]
                 
             # Clean up the address
             address = address.strip()
-            address = re.sub(r'\s+', ' ', address)  # Normalize whitespace
+            address = WHITESPACE_PATTERN.sub(' ', address)  # Normalize whitespace
             
             logger.debug(f"Extracted address: {address}")
             return address
@@ -70,20 +120,15 @@ def extract_address_from_article(article: Dict) -> Optional[str]:
         str or None: The extracted address, or None if no address found
     """
     # Check if we already have an address
-    if article.get('exactAddress') or article.get('detailed_location'):
-        return article.get('exactAddress') or article.get('detailed_location')
+    known_address = article.get('exactAddress') or article.get('detailed_location')
+    if known_address:
+        return known_address
         
     # Try to extract from various fields
-    potential_text_fields = [
-        'excerpt', 
-        'title',
-        'content',
-        'description'
-    ]
-    
-    for field in potential_text_fields:
-        if field in article and article[field]:
-            address = extract_address_from_text(article[field])
+    for field in ARTICLE_TEXT_FIELDS:
+        value = article.get(field)
+        if value:
+            address = extract_address_from_text(value)
             if address:
                 return address
                 
@@ -102,35 +147,17 @@ def normalize_address(address: str) -> str:
     if not address:
         return ""
         
-    # Common abbreviation mapping
-    abbr_map = {
-        r'\bSt\b': 'Street',
-        r'\bAve\b': 'Avenue',
-        r'\bBlvd\b': 'Boulevard',
-        r'\bRd\b': 'Road',
-        r'\bDr\b': 'Drive',
-        r'\bLn\b': 'Lane',
-        r'\bCt\b': 'Court',
-        r'\bPkwy\b': 'Parkway',
-        r'\bHwy\b': 'Highway',
-        r'\bSq\b': 'Square',
-        r'\bPl\b': 'Place',
-        r'\bTer\b': 'Terrace',
-    }
-    
     # Remove any confidence indicators or other parenthetical notes
-    address = re.sub(r'\s*\([^)]*\)', '', address)
+    address = PARENTHETICAL_PATTERN.sub('', address)
     
     # Apply abbreviation standardization
-    normalized = address
-    for abbr, full in abbr_map.items():
-        normalized = re.sub(abbr, full, normalized)
+    normalized = STREET_ABBREVIATION_PATTERN.sub(lambda match: STREET_ABBREVIATIONS[match.group()], address)
     
     # Ensure consistent comma separation
-    normalized = re.sub(r'\s*,\s*', ', ', normalized)
+    normalized = COMMA_PATTERN.sub(', ', normalized)
     
     # Ensure consistent spacing
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = WHITESPACE_PATTERN.sub(' ', normalized)
     
     # Clean up any trailing punctuation
     normalized = normalized.strip('.,; ')
@@ -147,19 +174,13 @@ def is_valid_address(address: str) -> bool:
     Returns:
         bool: True if the address appears valid, False otherwise
     """
-    if not address:
+    # Cheapest checks first: too-short addresses are rejected before any scan
+    if not address or len(address) <= 10:
         return False
         
     # Check if the address contains a number (most street addresses do)
-    has_number = bool(re.search(r'\d', address))
-    
+    if not DIGIT_PATTERN.search(address):
+        return False
+        
     # Check if the address contains a street type
-    street_types = ['street', 'st', 'avenue', 'ave', 'boulevard', 'blvd', 'road', 'rd', 
-                   'drive', 'dr', 'lane', 'ln', 'way', 'court', 'ct', 'plaza', 'plz', 
-                   'square', 'sq', 'highway', 'hwy', 'parkway', 'pkwy', 'terrace', 'ter', 'place', 'pl']
-    has_street_type = any(re.search(r'\b' + st + r'\b', address, re.IGNORECASE) for st in street_types)
-    
-    # Check if the address is too short
-    is_long_enough = len(address) > 10
-    
-    return has_number and has_street_type and is_long_enough
+    return bool(STREET_TYPE_PATTERN.search(address))
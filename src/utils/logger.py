@@ -26,6 +26,7 @@ import os
 import sys
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Union
 
@@ -49,10 +50,17 @@ LOG_BACKUP_COUNT = 5
 # Create a dictionary to store module specific loggers
 LOGGERS: Dict[str, logging.Logger] = {}
 
+# Rotating file handlers shared by every logger writing to the same file
+FILE_HANDLERS: Dict[Path, logging.Handler] = {}
+
+@lru_cache(maxsize=1)
 def get_log_dir() -> Path:
     """
     Get the log directory path, creating it if it doesn't exist.
     
+    The directory is resolved and created once per process; every logger
+    configured afterwards reuses the cached path.
+    
     Returns:
         Path: The path to the log directory
     """
@@ -73,6 +81,30 @@ def get_log_dir() -> Path:
     log_dir.mkdir(exist_ok=True)
     return log_dir
 
+def get_file_handler(log_file: Path) -> logging.Handler:
+    """
+    Get the rotating file handler for a log file, creating it on first use.
+    
+    Sharing one handler per file keeps a single open file descriptor and lets
+    the handler's lock serialize writes and rotation across loggers.
+    
+    Args:
+        log_file: Path of the log file
+    
+    Returns:
+        logging.Handler: The handler writing to log_file
+    """
+    handler = FILE_HANDLERS.get(log_file)
+    if handler is None:
+        handler = logging.handlers.RotatingFileHandler(
+            log_file, 
+            maxBytes=MAX_LOG_SIZE, 
+            backupCount=LOG_BACKUP_COUNT
+        )
+        handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT, DATE_FORMAT))
+        FILE_HANDLERS[log_file] = handler
+    return handler
+
 def configure_handlers(logger: logging.Logger, module_name: str) -> None:
     """
     Configure handlers for the logger including console and file handlers.
@@ -90,27 +122,13 @@ def configure_handlers(logger: logging.Logger, module_name: str) -> None:
     logger.addHandler(console_handler)
     
     # Configure file handler for general logs
-    log_file = get_log_dir() / DEFAULT_LOG_FILE
-    file_handler = logging.handlers.RotatingFileHandler(
-        log_file, 
-        maxBytes=MAX_LOG_SIZE, 
-        backupCount=LOG_BACKUP_COUNT
-    )
-    file_handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT, DATE_FORMAT))
-    logger.addHandler(file_handler)
+    logger.addHandler(get_file_handler(get_log_dir() / DEFAULT_LOG_FILE))
     
     # Configure component-specific log file if it's a main component
     components = ["scrapers", "analyzer", "nearby_finder"]
     for component in components:
         if component in module_name:
-            component_log_file = get_log_dir() / f"{component}.log"
-            component_handler = logging.handlers.RotatingFileHandler(
-                component_log_file, 
-                maxBytes=MAX_LOG_SIZE, 
-                backupCount=LOG_BACKUP_COUNT
-            )
-            component_handler.setFormatter(logging.Formatter(FILE_LOG_FORMAT, DATE_FORMAT))
-            logger.addHandler(component_handler)
+            logger.addHandler(get_file_handler(get_log_dir() / f"{component}.log"))
             break
 
 def get_logger(
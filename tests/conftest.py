@@ -48,6 +48,7 @@ def mock_response():
             self.json_data = json_data
             self.status_code = status_code
             self.text = json.dumps(json_data)
+            self.content = self.text.encode()
             
         def json(self):
             return self.json_data
@@ -328,4 +328,27 @@ def test_insert_analysis_result_foreign_key_constraint(in_memory_db):
             ''',
             (non_existent_article_id, 'Robbery', 'Smash and grab', 'Jewelry store', 'Retail', 'Test Store', 4, 5, 9, now)
         )
-        conn.commit()
\ No newline at end of file
+        conn.commit()
+
+
+def test_url_lookup_uses_index(tmp_path, monkeypatch):
+    """
+    Test that URL lookups are answered from the unique index on url.
+    
+    Duplicate checks before inserting articles rely on this to avoid scanning the table.
+    """
+    monkeypatch.setattr('src.database.DATABASE_FILE', str(tmp_path / 'test.db'))
+    assert initialize_database()
+    
+    conn = get_db_connection()
+    try:
+        plan = " ".join(
+            row[-1] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT url FROM articles WHERE url IN (?, ?)",
+                ('https://example.com/a', 'https://example.com/b')
+            )
+        )
+    finally:
+        conn.close()
+    
+    assert "COVERING INDEX" in plan
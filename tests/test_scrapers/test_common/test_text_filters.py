@@ -0,0 +1,84 @@
+"""
+Tests for the shared text filtering functions.
+
+These tests verify the matchers built from scraper configuration, including:
+- Whole-word keyword extraction and matching
+- Combined theft and business analysis
+- Location detection priority and defaults
+- Date parsing against a format list
+"""
+
+import pytest
+
+from src.scrapers.common.text_filters import (
+    make_keyword_extractor, make_keyword_matcher, make_location_detector, make_text_analyzer, parse_date
+)
+
+LOCATIONS = {
+    "Nevada": ["Nevada", "NV", "Las Vegas"],
+    "Texas": ["Texas", "TX", "Dallas"]
+}
+
+class TestTextFilters:
+    """Test suite for the shared text filters."""
+    
+    def test_keyword_extractor(self):
+        """Test that only whole-word keywords are extracted, in configuration order."""
+        extract = make_keyword_extractor(["smash and grab", "theft", "robbery"])
+        
+        assert extract("Robbery and THEFT reported") == ["theft", "robbery"]
+        assert extract("thefts reported") == []
+    
+    def test_keyword_matcher(self):
+        """Test business keyword matching."""
+        matches = make_keyword_matcher(["store", "retail"])
+        
+        assert matches("The store was robbed") is True
+        assert matches("The storefront was robbed") is False
+    
+    def test_text_analyzer(self):
+        """Test combined theft keyword extraction and business relevance."""
+        analyze = make_text_analyzer(["theft", "robbery"], ["store"])
+        
+        assert analyze("Store ROBBERY and theft") == (["theft", "robbery"], True)
+        assert analyze("store opening", already_lower=True) == ([], True)
+        assert analyze("Weather update") == ([], False)
+        assert analyze is make_text_analyzer(("theft", "robbery"), ("store",))
+    
+    def test_location_detector_priority(self):
+        """Test that the earliest configured location wins regardless of text order."""
+        detect = make_location_detector(LOCATIONS)
+        
+        assert detect("From Dallas to Las Vegas") == "Nevada"
+        assert detect("A Dallas store") == "Texas"
+        assert detect("Nowhere in particular") is None
+    
+    def test_location_detector_preferred_and_default(self):
+        """Test the preferred location and the fallback when nothing is mentioned."""
+        detect = make_location_detector(LOCATIONS, preferred="Texas", default="Nevada")
+        
+        assert detect("From Dallas to Las Vegas") == "Texas"
+        assert detect("Nowhere in particular") == "Nevada"
+    
+    def test_matchers_are_shared(self):
+        """Test that identical configurations reuse the same matcher."""
+        assert make_keyword_extractor(["theft"]) is make_keyword_extractor(["theft"])
+        assert make_location_detector(LOCATIONS) is make_location_detector(dict(LOCATIONS))
+    
+    @pytest.mark.parametrize("date_str,expected", [
+        ("2025-03-15", "2025-03-15"),
+        ("March 15, 2025", "2025-03-15"),
+        ("not a date", None)
+    ])
+    def test_parse_date(self, date_str, expected):
+        """Test date parsing against a format list."""
+        assert parse_date(date_str, ('%Y-%m-%d', '%B %d, %Y')) == expected
+    
+    def test_location_detector_nested_variations(self):
+        """Test that a variation containing another location's name honors priority."""
+        detect = make_location_detector({
+            "Kansas": ["Kansas", "KS"],
+            "Missouri": ["Missouri", "MO", "Kansas City"]
+        })
+        
+        assert detect("A store in Kansas City") == "Kansas"
@@ -0,0 +1,59 @@
+"""
+Tests for the shared WebDriver helpers.
+
+These tests verify the browser state shared by the Selenium scrapers, including:
+- Driver pooling, reuse order and discarding of dirty drivers
+- One-time chromedriver resolution across threads
+"""
+
+import threading
+from unittest.mock import patch, MagicMock
+
+from src.scrapers.common import webdriver
+from src.scrapers.common.webdriver import DriverPool, chromedriver_path
+
+class TestDriverPool:
+    """Test suite for the WebDriver pool."""
+
+    def test_reuses_most_recent_driver(self):
+        """Test that released drivers are handed out last in, first out."""
+        pool = DriverPool(2)
+        first, second = MagicMock(), MagicMock()
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.acquire() is second
+        assert pool.acquire() is first
+        assert pool.acquire() is None
+
+    def test_dirty_or_extra_drivers_are_quit(self):
+        """Test that dirty drivers and drivers beyond the pool size are quit."""
+        pool = DriverPool(1)
+        dirty, kept, extra = MagicMock(), MagicMock(), MagicMock()
+
+        pool.release(dirty, dirty=True)
+        pool.release(kept)
+        pool.release(extra)
+
+        dirty.quit.assert_called_once()
+        kept.quit.assert_not_called()
+        extra.quit.assert_called_once()
+
+        pool.shutdown()
+        kept.quit.assert_called_once()
+        assert pool.empty()
+
+    @patch.object(webdriver, '_driver_path', None)
+    @patch.object(webdriver, 'ChromeDriverManager')
+    def test_chromedriver_resolved_once(self, mock_manager):
+        """Test that concurrent callers share a single webdriver_manager install."""
+        mock_manager.return_value.install.return_value = "/tmp/chromedriver"
+
+        threads = [threading.Thread(target=chromedriver_path) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert chromedriver_path() == "/tmp/chromedriver"
+        mock_manager.return_value.install.assert_called_once()
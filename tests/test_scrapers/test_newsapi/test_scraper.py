@@ -13,8 +13,10 @@ import json
 import os
 from unittest.mock import patch, MagicMock
 
-from src.scrapers.newsapi.scraper import NewsAPIScraper
-from src.scrapers.newsapi.utils import detect_location, extract_keywords, is_business_related
+from src.scrapers.newsapi.scraper import NewsAPIScraper, RateLimiter
+from src.scrapers.newsapi.utils import (
+    business_related_flags, detect_location, extract_keywords, is_business_related
+)
 from src.utils.exceptions import ScraperNetworkError
 
 class TestNewsAPIScraper:
@@ -102,6 +104,48 @@ class TestNewsAPIScraper:
         luxury_content = "The high-end retail store was targeted by thieves."
         assert scraper._detect_store_type(luxury_content) == "Luxury Retail"
         
+    @patch('src.scrapers.newsapi.scraper.time.sleep')
+    @patch.object(NewsAPIScraper, 'search_articles')
+    def test_scrape_skips_duplicate_urls(self, mock_search, mock_sleep, newsapi_mock_data):
+        """Test that articles returned by overlapping search terms are only kept once."""
+        mock_search.return_value = newsapi_mock_data
+        
+        scraper = NewsAPIScraper()
+        with patch('src.scrapers.newsapi.scraper.is_business_related') as mock_business:
+            results = scraper.scrape()
+        
+        urls = [article['url'] for articles in results.values() for article in articles]
+        assert mock_search.call_count == len(scraper.config["search_terms"])
+        assert len(urls) == len(set(urls))
+        assert "https://example.com/vegas-robbery" in urls
+        # The batch scan already settled business relevance for every candidate
+        mock_business.assert_not_called()
+        
+    @patch('src.scrapers.newsapi.scraper.time.sleep')
+    @patch('src.scrapers.newsapi.scraper.time.monotonic', return_value=100.0)
+    def test_rate_limiter_spaces_requests(self, mock_monotonic, mock_sleep):
+        """Test that back-to-back requests are spaced by the minimum interval."""
+        limiter = RateLimiter(1.0)
+        
+        limiter.wait()
+        limiter.wait()
+        limiter.wait()
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+        
+    @patch('src.scrapers.newsapi.scraper.orjson', json)
+    @patch('requests.Session.get')
+    def test_search_articles_decodes_raw_content(self, mock_get, mock_response, newsapi_mock_data):
+        """Test that the raw response body is decoded when a fast JSON parser is available."""
+        response = mock_response(None, 200)
+        response.content = json.dumps(newsapi_mock_data).encode()
+        mock_get.return_value = response
+        
+        scraper = NewsAPIScraper()
+        result = scraper.search_articles("jewelry theft")
+        
+        assert result == newsapi_mock_data
+        
 class TestNewsAPIUtils:
     """Test suite for the NewsAPI utility functions."""
     
@@ -136,4 +180,14 @@ class TestNewsAPIUtils:
         
         # Test non-business related content
         personal_text = "The woman had her purse stolen at the park."
-        assert is_business_related(personal_text) is False
\ No newline at end of file
+        assert is_business_related(personal_text) is False
+        
+    def test_business_related_flags(self):
+        """Test batch business relevance detection."""
+        contents = [
+            "The jewelry store owner reported the theft to police.",
+            "The woman had her purse stolen at the park.",
+            "Thieves hit a Retail shop downtown."
+        ]
+        assert business_related_flags(contents) == [is_business_related(c) for c in contents]
+        assert business_related_flags([]) == []
@@ -11,10 +11,24 @@ import pytest
 import os
 from unittest.mock import patch, MagicMock
 
-from src.scrapers.reviewjournal.scraper import ReviewJournalScraper
-from src.scrapers.reviewjournal.utils import extract_keywords, is_business_related, detect_location
+from src.scrapers.reviewjournal.config import REVIEWJOURNAL_CONFIG
+from src.scrapers.reviewjournal.scraper import ReviewJournalScraper, NOT_MODIFIED
+from src.scrapers.reviewjournal.utils import analyze_text, classify_article, extract_keywords, is_business_related, detect_location
 from src.utils.exceptions import ScraperNetworkError
 
+@pytest.fixture(autouse=True)
+def article_cache_dir(tmp_path, monkeypatch):
+    """Keep the persistent article cache out of the project output directory."""
+    monkeypatch.setattr('src.scrapers.reviewjournal.scraper.OUTPUT_DIR', str(tmp_path))
+    return tmp_path
+
+@pytest.fixture(autouse=True)
+def empty_driver_pool():
+    """Keep pooled drivers from leaking between tests."""
+    ReviewJournalScraper.shutdown_drivers()
+    yield
+    ReviewJournalScraper.shutdown_drivers()
+
 class TestReviewJournalScraper:
     """Test suite for the Review Journal scraper."""
 
@@ -71,9 +85,264 @@ class TestReviewJournalScraper:
         results = scraper.scrape_crime_news()
 
         # Verify results
+        assert type(results) is dict
         assert "Nevada" in results
         assert len(results["Nevada"]) > 0
 
+    @patch.object(ReviewJournalScraper, '_classify_link')
+    @patch.object(ReviewJournalScraper, 'fetch_page')
+    def test_scrape_reuses_cached_articles(self, mock_fetch, mock_classify):
+        """Test that links classified in an earlier run are not classified again."""
+        mock_fetch.return_value = """
+        <html><body>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas</a>
+            <p>A jewelry store was robbed in downtown Las Vegas yesterday.</p>
+        </body></html>
+        """
+        mock_classify.side_effect = lambda link: {"title": link[0], "url": link[1]}
+
+        first = ReviewJournalScraper().scrape_crime_news()
+        second = ReviewJournalScraper().scrape_crime_news()
+
+        assert first["Nevada"] == second["Nevada"]
+        assert len(second["Nevada"]) == 1
+        mock_classify.assert_called_once()
+
+    @patch.object(ReviewJournalScraper, '_classify_link')
+    @patch.object(ReviewJournalScraper, 'fetch_page')
+    def test_scrape_reclassifies_irrelevant_and_expired_links(self, mock_fetch, mock_classify):
+        """Test that irrelevant links are not cached and expired articles are classified again."""
+        mock_fetch.return_value = """
+        <html><body>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas</a>
+            <a href="/crime/test-article-2/">Weekend weather forecast update</a>
+        </body></html>
+        """
+        mock_classify.side_effect = lambda link: {"title": link[0], "url": link[1]} if "Robbery" in link[0] else None
+
+        ReviewJournalScraper().scrape_crime_news()
+        ReviewJournalScraper().scrape_crime_news()
+        assert [c.args[0][0] for c in mock_classify.call_args_list[2:]] == ["Weekend weather forecast update"]
+
+        mock_classify.reset_mock()
+        with patch.dict(REVIEWJOURNAL_CONFIG, {"article_cache_max_age_hours": 0}):
+            results = ReviewJournalScraper().scrape_crime_news()
+        assert mock_classify.call_count == 2
+        assert len(results["Nevada"]) == 1
+
+    @patch.object(ReviewJournalScraper, 'fetch_page')
+    def test_scrape_keeps_relevant_anchor_for_repeated_url(self, mock_fetch):
+        """Test that an irrelevant first link to a URL does not hide a relevant later one."""
+        mock_fetch.return_value = """
+        <html><body>
+            <a href="/crime/test-article-1/">Continue reading this story</a>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas</a>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas (video)</a>
+        </body></html>
+        """
+
+        results = ReviewJournalScraper().scrape_crime_news()
+
+        assert [article["title"] for article in results["Nevada"]] == ["Jewelry Store Robbery in Las Vegas"]
+
+    @patch.object(ReviewJournalScraper, '_classify_link')
+    @patch.object(ReviewJournalScraper, 'fetch_page')
+    def test_scrape_ignores_cache_from_other_configuration(self, mock_fetch, mock_classify):
+        """Test that articles cached under different keywords or locations are classified again."""
+        mock_fetch.return_value = """
+        <html><body>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas</a>
+        </body></html>
+        """
+        mock_classify.side_effect = lambda link: {"title": link[0], "url": link[1]}
+
+        ReviewJournalScraper().scrape_crime_news()
+        with patch('src.scrapers.reviewjournal.scraper.ARTICLE_CACHE_VERSION', "changed"):
+            ReviewJournalScraper().scrape_crime_news()
+
+        assert mock_classify.call_count == 2
+        assert mock_fetch.call_args.kwargs["conditional"] is False
+
+    def test_article_cache_pruned_lazily(self):
+        """Test that stale entries are dropped when read and swept at most once per interval."""
+        scraper = ReviewJournalScraper()
+        url = "https://www.reviewjournal.com/crime/test-article-1/"
+        stale = {"version": "old", "stored_at": 0.0, "value": {}}
+
+        article_cache = scraper._open_article_cache()
+        scraper._cache_put(article_cache, url, {"title": "Robbery"})
+        article_cache["unread"] = article_cache["read"] = stale
+        article_cache.close()
+
+        article_cache = scraper._open_article_cache()
+        assert "unread" in article_cache
+        assert scraper._cache_get(article_cache, "read") is None
+        assert "read" not in article_cache
+        article_cache.close()
+
+        with patch.dict(REVIEWJOURNAL_CONFIG, {"article_cache_prune_interval_hours": 0}):
+            article_cache = scraper._open_article_cache()
+        assert "unread" not in article_cache
+        assert scraper._cache_get(article_cache, url) == {"title": "Robbery"}
+        article_cache.close()
+
+    @patch.object(ReviewJournalScraper, '_classify_link')
+    @patch.object(ReviewJournalScraper, 'fetch_page')
+    def test_scrape_unmodified_page_uses_cached_listing(self, mock_fetch, mock_classify):
+        """Test that an unchanged crime page is served from the cache without parsing."""
+        mock_fetch.return_value = """
+        <html><body>
+            <a href="/crime/test-article-1/">Jewelry Store Robbery in Las Vegas</a>
+        </body></html>
+        """
+        mock_classify.side_effect = lambda link: {"title": link[0], "url": link[1]}
+
+        first = ReviewJournalScraper().scrape_crime_news()
+        mock_fetch.return_value = NOT_MODIFIED
+        second = ReviewJournalScraper().scrape_crime_news()
+
+        assert first["Nevada"] == second["Nevada"]
+        assert mock_fetch.call_args.kwargs["conditional"] is True
+        mock_classify.assert_called_once()
+
+    @patch('src.scrapers.reviewjournal.scraper.http_session')
+    def test_fetch_with_requests_sends_validators(self, mock_session):
+        """Test that saved validators are sent back and a 304 returns NOT_MODIFIED."""
+        response = mock_session.get.return_value.__enter__.return_value
+        response.status_code = 200
+        response.headers = {'ETag': '"abc"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+        response.encoding = 'utf-8'
+        response.iter_content.return_value = iter([b"<html><body>" + b"x" * 200 + b"</body></html>"])
+
+        scraper = ReviewJournalScraper()
+        assert scraper._fetch_with_requests(scraper.url)
+        scraper._save_validators(scraper.url, scraper._pending_validators)
+
+        response.status_code = 304
+        assert scraper._fetch_with_requests(scraper.url, conditional=True) is NOT_MODIFIED
+        assert mock_session.get.call_args.kwargs["headers"] == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'
+        }
+
+    @patch.object(ReviewJournalScraper, 'setup_driver')
+    @patch.object(ReviewJournalScraper, '_collect_links', side_effect=Exception("parse failed"))
+    @patch('src.scrapers.reviewjournal.scraper.http_session')
+    def test_validators_not_saved_for_failed_run(self, mock_session, mock_collect, mock_setup):
+        """Test that validators are only saved once the listing they belong to is cached."""
+        response = mock_session.get.return_value.__enter__.return_value
+        response.status_code = 200
+        response.headers = {'ETag': '"abc"'}
+        response.encoding = 'utf-8'
+        links = "".join(f'<a href="/crime/article-{i}/">Article {i} headline text</a>' for i in range(5))
+        response.iter_content.return_value = iter([f"<html><body>{links}</body></html>".encode()])
+
+        scraper = ReviewJournalScraper()
+        scraper.scrape_crime_news()
+        assert scraper._load_validators() == {}
+
+        mock_collect.side_effect = None
+        mock_collect.return_value = []
+        response.iter_content.return_value = iter([f"<html><body>{links}</body></html>".encode()])
+        scraper.scrape_crime_news()
+        assert scraper._load_validators()[scraper.url]["etag"] == '"abc"'
+
+    @patch.object(ReviewJournalScraper, 'setup_driver')
+    @patch.object(ReviewJournalScraper, '_fetch_with_requests')
+    def test_fetch_page_uses_static_html(self, mock_requests, mock_setup):
+        """Test that static HTML with an article listing is used without starting a browser."""
+        links = "".join(f'<a href="/crime/article-{i}/">Article {i} headline text</a>' for i in range(5))
+        mock_requests.return_value = f"<html><body>{links}</body></html>"
+
+        scraper = ReviewJournalScraper()
+        page = scraper.fetch_page(scraper.url)
+
+        assert page == mock_requests.return_value
+        mock_setup.assert_not_called()
+
+    @patch.object(ReviewJournalScraper, 'setup_driver')
+    @patch.object(ReviewJournalScraper, '_fetch_with_requests')
+    def test_fetch_page_renders_when_listing_missing(self, mock_requests, mock_setup):
+        """Test that Selenium is used when static HTML lacks the article listing."""
+        mock_requests.return_value = "<html><body>" + "x" * 200 + "</body></html>"
+        rendered = "<html><body>" + "<p>rendered</p>" * 20 + "</body></html>"
+
+        scraper = ReviewJournalScraper()
+
+        def setup():
+            scraper.driver = MagicMock(page_source=rendered)
+        mock_setup.side_effect = setup
+
+        assert scraper.fetch_page(scraper.url) == rendered
+        mock_setup.assert_called_once()
+
+    @patch.object(ReviewJournalScraper, 'scroll_to_load_more')
+    @patch.object(ReviewJournalScraper, 'setup_driver', autospec=True)
+    @patch.object(ReviewJournalScraper, '_fetch_with_requests')
+    def test_static_html_needs_rendered_link_count(self, mock_requests, mock_setup, mock_scroll):
+        """Test that static HTML is only used once it has every link of the last scrolled render."""
+        def listing(count):
+            links = "".join(f'<a href="/crime/article-{i}/">Article {i} headline text</a>' for i in range(count))
+            return f"<html><body>{links}</body></html>"
+
+        driver = MagicMock(page_source=listing(8))
+        mock_setup.side_effect = lambda scraper: setattr(scraper, 'driver', driver)
+
+        def renders():
+            return sum(1 for c in driver.get.call_args_list if c.args[0] == REVIEWJOURNAL_CONFIG["url"])
+
+        # Nothing is known about the page yet, so it is rendered
+        mock_requests.return_value = listing(5)
+        ReviewJournalScraper().scrape_crime_news()
+        assert renders() == 1
+
+        # Static HTML with fewer links than the scrolled page is missing articles
+        ReviewJournalScraper().scrape_crime_news()
+        assert renders() == 2
+
+        mock_requests.return_value = listing(8)
+        ReviewJournalScraper().scrape_crime_news()
+        assert renders() == 2
+
+    def test_read_until_listing_end(self):
+        """Test that streamed HTML is cut at the end of the article listing."""
+        response = MagicMock(encoding='utf-8')
+        response.iter_content.return_value = iter([b"<main><a>Article</a></ma", b"in><footer>ads</footer>"])
+
+        scraper = ReviewJournalScraper()
+
+        assert scraper._read_until_listing_end(response) == "<main><a>Article</a></main>"
+
+    @patch.object(ReviewJournalScraper, 'setup_driver')
+    def test_driver_reused_across_scrapes(self, mock_setup):
+        """Test that a released driver is handed to the next scraper instead of a new one."""
+        driver = MagicMock()
+
+        first = ReviewJournalScraper()
+        first.driver = driver
+        first._release_driver()
+
+        second = ReviewJournalScraper()
+        assert second._acquire_driver() is driver
+        driver.quit.assert_not_called()
+        mock_setup.assert_not_called()
+
+    @patch.object(ReviewJournalScraper, 'setup_driver')
+    def test_dirty_driver_not_pooled(self, mock_setup):
+        """Test that a driver which hit a navigation error is quit instead of pooled."""
+        driver = MagicMock()
+        driver.get.side_effect = Exception("tab crashed")
+
+        scraper = ReviewJournalScraper()
+        scraper.driver = driver
+        with patch.object(ReviewJournalScraper, '_fetch_with_requests', return_value=None), \
+                patch('src.scrapers.reviewjournal.scraper.time.sleep'):
+            scraper.fetch_page(scraper.url)
+        scraper._release_driver()
+
+        driver.quit.assert_called_once()
+        assert ReviewJournalScraper._driver_pool.empty()
+
     def test_utility_functions(self):
         """Test the utility functions used by the Review Journal scraper."""
         # Test keyword extraction
@@ -89,4 +358,13 @@ class TestReviewJournalScraper:
         assert is_business_related(test_text) is True
 
         # Test location detection (should prioritize Nevada for Review Journal)
-        assert detect_location(test_text) == "Nevada"
\ No newline at end of file
+        assert detect_location(test_text) == "Nevada"
+
+        # Test the combined analysis matches the individual checks
+        assert analyze_text(test_text) == (keywords, True)
+
+        # Test classification of a listing link from plain strings
+        article = classify_article("Store robbery", "https://example.com/crime/a/", None, "", "Review Journal")
+        assert article["keywords"] == ["robbery"]
+        assert article["date"] == ""
+        assert classify_article("Weather update", "https://example.com/local/b/", None, "", "Review Journal") is None
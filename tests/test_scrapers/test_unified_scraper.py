@@ -8,12 +8,17 @@ These tests verify the functionality of the unified scraper, including:
 - Saving combined results
 """
 
+import copy
+import csv
 import pytest
 import os
+import threading
+import time
 import json
 from unittest.mock import patch, MagicMock, mock_open
 
 from src.scrapers.unified import UnifiedScraper
+from src.database import get_db_connection, initialize_database
 
 class TestUnifiedScraper:
     """Test suite for the Unified Scraper."""
@@ -121,6 +126,291 @@ class TestUnifiedScraper:
         # Verify save was called
         mock_save.assert_called_once()
 
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch('src.scrapers.unified.JSAScraper')
+    @patch('src.scrapers.unified.NewsAPIScraper')
+    @patch('src.scrapers.unified.ReviewJournalScraper')
+    def test_scrape_all_isolates_failures(self, mock_rj_class, mock_newsapi_class, mock_jsa_class, mock_save):
+        """Test that a failing scraper does not affect the others running alongside it."""
+        self.mock_newsapi.scrape.side_effect = Exception("API down")
+        mock_jsa_class.return_value = self.mock_jsa
+        mock_newsapi_class.return_value = self.mock_newsapi
+        mock_rj_class.return_value = self.mock_reviewjournal
+
+        unified = UnifiedScraper()
+        unified.scrapers = {
+            "jsa": self.mock_jsa,
+            "newsapi": self.mock_newsapi,
+            "reviewjournal": self.mock_reviewjournal
+        }
+
+        results = unified.scrape_all(deep_check=False)
+
+        assert list(results) == ["jsa", "newsapi", "reviewjournal"]
+        assert results["newsapi"] == {}
+        assert results["jsa"] == self.mock_jsa.scrape.return_value
+        assert results["reviewjournal"] == self.mock_reviewjournal.scrape.return_value
+
+    def test_save_to_database(self, tmp_path):
+        """Test that articles are inserted in one batch and the first article per URL is kept."""
+        results = {
+            "jsa": self.mock_jsa.scrape.return_value,
+            "newsapi": self.mock_newsapi.scrape.return_value,
+            "reviewjournal": {"Nevada": [
+                {"title": "Missing fields"},
+                dict(self.mock_jsa.scrape.return_value["Nevada"][0], title="Same URL, later scraper")
+            ]}
+        }
+
+        with patch('src.database.DATABASE_FILE', str(tmp_path / 'test.db')):
+            initialize_database()
+            unified = UnifiedScraper()
+            assert unified._save_to_database(results) is True
+            assert unified._save_to_database(results) is True
+
+            with get_db_connection() as conn:
+                rows = [tuple(row) for row in conn.execute("SELECT url, title FROM articles ORDER BY id")]
+
+        assert rows == [
+            ("https://example.com/jsa1", "JSA Test Article 1"),
+            ("https://example.com/newsapi1", "NewsAPI Test Article 1")
+        ]
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch('src.scrapers.unified.JSAScraper')
+    @patch('src.scrapers.unified.NewsAPIScraper')
+    @patch('src.scrapers.unified.ReviewJournalScraper')
+    def test_scrape_all_builds_only_requested_sources(self, mock_rj_class, mock_newsapi_class, mock_jsa_class, mock_save):
+        """Test that scrapers are constructed lazily and only for the requested sources."""
+        mock_jsa_class.return_value = self.mock_jsa
+
+        unified = UnifiedScraper()
+        results = unified.scrape_all(deep_check=False, sources=["jsa"])
+
+        assert list(results) == ["jsa"]
+        mock_jsa_class.assert_called_once()
+        mock_newsapi_class.assert_not_called()
+        mock_rj_class.assert_not_called()
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    def test_scrape_all_rejects_unknown_sources(self, mock_save):
+        """Test that an unknown source is rejected before any scraper starts."""
+        unified = UnifiedScraper()
+        unified.scrapers = {"jsa": self.mock_jsa, "newsapi": self.mock_newsapi}
+
+        with pytest.raises(ValueError, match="nope"):
+            unified.scrape_all(deep_check=False, sources=["jsa", "nope"])
+
+        self.mock_jsa.scrape.assert_not_called()
+        mock_save.assert_not_called()
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch.object(UnifiedScraper, 'SCRAPER_TIMEOUT_SECONDS', 0.2)
+    def test_scrape_all_skips_stuck_scraper(self, mock_save):
+        """Test that a scraper running past the timeout is stopped and skipped without blocking the others."""
+        release = threading.Event()
+        daemon_threads = []
+
+        def stuck_scrape(**kwargs):
+            daemon_threads.append(threading.current_thread().daemon)
+            release.wait(5)
+
+        self.mock_newsapi.scrape.side_effect = stuck_scrape
+
+        unified = UnifiedScraper()
+        unified.scrapers = {"newsapi": self.mock_newsapi, "jsa": self.mock_jsa}
+
+        try:
+            results = unified.scrape_all(deep_check=False)
+        finally:
+            release.set()
+
+        assert results["newsapi"] == {}
+        assert results["jsa"] == self.mock_jsa.scrape.return_value
+        # The stuck scraper cannot block interpreter exit, is told to stop and is
+        # not reused by the next run
+        assert daemon_threads == [True]
+        self.mock_newsapi.stop.assert_called_once()
+        self.mock_jsa.stop.assert_not_called()
+        assert unified.get_scraper("newsapi") is not self.mock_newsapi
+        assert unified.get_scraper("jsa") is self.mock_jsa
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch('src.scrapers.unified.chromedriver_path')
+    def test_scrape_all_runs_browser_scrapers_one_at_a_time(self, mock_driver_path, mock_save):
+        """Test that browser scrapers never overlap while API scrapers run alongside them."""
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+        api_started = threading.Event()
+
+        def browser_scrape(**kwargs):
+            assert mock_driver_path.called
+            with lock:
+                running.append(1)
+                overlaps.append(len(running) > 1)
+            api_started.wait(1)
+            with lock:
+                running.pop()
+            return {}
+
+        def api_scrape(**kwargs):
+            api_started.set()
+            return {}
+
+        self.mock_jsa.scrape.side_effect = browser_scrape
+        self.mock_reviewjournal.scrape.side_effect = browser_scrape
+        self.mock_newsapi.scrape.side_effect = api_scrape
+
+        unified = UnifiedScraper()
+        unified.scrapers = {
+            "jsa": self.mock_jsa,
+            "reviewjournal": self.mock_reviewjournal,
+            "newsapi": self.mock_newsapi
+        }
+        unified.scrape_all(deep_check=False)
+
+        assert overlaps == [False, False]
+        assert api_started.is_set()
+        mock_driver_path.assert_called_once()
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch('src.scrapers.unified.chromedriver_path')
+    @patch.object(UnifiedScraper, 'SCRAPER_TIMEOUT_SECONDS', 0.5)
+    def test_scrape_all_times_browser_scrapers_from_their_start(self, mock_driver_path, mock_save):
+        """Test that browser scrapers waiting for their turn are not charged for the ones before them."""
+        def slow_scrape(**kwargs):
+            time.sleep(0.3)
+            return {"Dallas": [{"title": "Robbery"}]}
+
+        self.mock_jsa.scrape.side_effect = slow_scrape
+        self.mock_reviewjournal.scrape.side_effect = slow_scrape
+
+        unified = UnifiedScraper()
+        unified.scrapers = {"jsa": self.mock_jsa, "reviewjournal": self.mock_reviewjournal}
+        results = unified.scrape_all(deep_check=False)
+
+        assert results["jsa"] == {"Dallas": [{"title": "Robbery"}]}
+        assert results["reviewjournal"] == {"Dallas": [{"title": "Robbery"}]}
+        self.mock_jsa.stop.assert_not_called()
+        self.mock_reviewjournal.stop.assert_not_called()
+
+    @patch('src.scrapers.unified.UnifiedScraper._save_results')
+    @patch('src.scrapers.unified.chromedriver_path')
+    @patch.object(UnifiedScraper, 'SCRAPER_TIMEOUT_SECONDS', 0.2)
+    def test_scrape_all_skips_browser_scrapers_behind_stuck_one(self, mock_driver_path, mock_save):
+        """Test that browser scrapers queued behind a stuck one are skipped without starting."""
+        release = threading.Event()
+        self.mock_jsa.scrape.side_effect = lambda **kwargs: release.wait(5)
+
+        unified = UnifiedScraper()
+        unified.scrapers = {
+            "jsa": self.mock_jsa,
+            "reviewjournal": self.mock_reviewjournal,
+            "newsapi": self.mock_newsapi
+        }
+
+        try:
+            results = unified.scrape_all(deep_check=False)
+        finally:
+            release.set()
+
+        assert results["jsa"] == {}
+        assert results["reviewjournal"] == {}
+        assert results["newsapi"] == self.mock_newsapi.scrape.return_value
+        self.mock_jsa.stop.assert_called_once()
+        self.mock_reviewjournal.scrape.assert_not_called()
+
+    @patch('src.scrapers.unified.URL_LOOKUP_CHUNK_SIZE', 2)
+    def test_existing_urls(self, tmp_path):
+        """Test that stored URLs are found across several lookup chunks."""
+        results = {"jsa": self.mock_jsa.scrape.return_value, "newsapi": self.mock_newsapi.scrape.return_value}
+
+        with patch('src.database.DATABASE_FILE', str(tmp_path / 'test.db')):
+            initialize_database()
+            unified = UnifiedScraper()
+            unified._save_to_database(results)
+
+            with get_db_connection() as conn:
+                existing = unified._existing_urls(conn.cursor(), {
+                    "https://example.com/jsa1", "https://example.com/new",
+                    "https://example.com/newsapi1", "https://example.com/other"
+                })
+
+        assert existing == {"https://example.com/jsa1", "https://example.com/newsapi1"}
+
+    def test_write_csv_file(self, tmp_path):
+        """Test that CSV rows follow the header column order."""
+        output_file = tmp_path / 'articles.csv'
+
+        unified = UnifiedScraper()
+        unified._write_csv_file(str(output_file), self.mock_newsapi.scrape.return_value)
+
+        with open(output_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
+        assert len(rows) == 1
+        assert rows[0]['location'] == "Texas"
+        assert rows[0]['keywords'] == "jewelry,robbery"
+        assert rows[0]['store_type'] == "Jewelry Store"
+        assert rows[0]['business_name'] == ""
+
+    @pytest.mark.parametrize("database_success,write_csv,csv_written", [
+        (True, False, False),
+        (True, True, True),
+        (False, False, True)
+    ])
+    def test_save_results_csv_fallback(self, database_success, write_csv, csv_written):
+        """Test that CSV files are only written on request or when the database save fails."""
+        unified = UnifiedScraper(write_csv=write_csv)
+
+        with patch.object(unified, '_save_to_database', return_value=database_success) as mock_database, \
+                patch.object(unified, '_save_results_to_csv') as mock_csv, \
+                patch('os.makedirs'):
+            unified._save_results({"jsa": self.mock_jsa.scrape.return_value})
+
+        assert mock_csv.called is csv_written
+        if csv_written:
+            # The database and CSV outputs are stamped with the same time
+            assert mock_csv.call_args.args[1] is mock_database.call_args.args[1]
+
+    def test_save_results_to_csv(self, tmp_path, monkeypatch):
+        """Test that one CSV file is written per scraper with results."""
+        monkeypatch.chdir(tmp_path)
+        os.makedirs('output')
+
+        unified = UnifiedScraper()
+        unified._save_results_to_csv({
+            "jsa": self.mock_jsa.scrape.return_value,
+            "newsapi": self.mock_newsapi.scrape.return_value,
+            "wfaa": {}
+        })
+
+        files = sorted(os.listdir('output'))
+        assert len(files) == 2
+        assert files[0].startswith("jsa_articles_")
+        assert files[1].startswith("newsapi_articles_")
+
+    def test_save_results_shares_keyword_string(self, tmp_path, monkeypatch):
+        """Test that database rows and CSV files get the same joined keywords without touching the articles."""
+        monkeypatch.chdir(tmp_path)
+        results = {"jsa": self.mock_jsa.scrape.return_value}
+        original = copy.deepcopy(results)
+
+        with patch('src.database.DATABASE_FILE', str(tmp_path / 'test.db')):
+            initialize_database()
+            unified = UnifiedScraper(write_csv=True)
+            unified._save_results(results)
+
+            with get_db_connection() as conn:
+                stored = conn.execute("SELECT keywords FROM articles").fetchone()['keywords']
+
+        with open(os.path.join('output', os.listdir('output')[0]), newline='', encoding='utf-8') as f:
+            written = next(csv.DictReader(f))['keywords']
+
+        assert stored == written == "jewelry,theft"
+        assert results == original
+
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.makedirs')
     @patch('src.scrapers.unified.JSAScraper')
@@ -133,8 +423,8 @@ class TestUnifiedScraper:
         mock_newsapi_class.return_value = self.mock_newsapi
         mock_rj_class.return_value = self.mock_reviewjournal
 
-        # Create unified scraper with mocked components
-        unified = UnifiedScraper()
+        # Create unified scraper with mocked components and CSV export enabled
+        unified = UnifiedScraper(write_csv=True)
 
         # Run scrapers
         results = unified.scrape_all(deep_check=False)
@@ -0,0 +1,118 @@
+"""
+Tests for the WFAA scraper module.
+
+These tests verify the functionality of the WFAA scraper, including:
+- HTML parsing and article extraction
+- WebDriver reuse across scrapes
+- Location detection for Texas-focused content
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from bs4 import BeautifulSoup
+
+from src.scrapers.wfaa.scraper import WFAAScraper
+from src.scrapers.wfaa.utils import analyze_text, detect_location
+
+SAMPLE_HTML = """
+<html>
+<body>
+    <article class="grid__module">
+        <h3 class="grid__module-heading"><a href="/article/news/crime/store-robbery/1">Dallas jewelry store robbed</a></h3>
+        <p class="grid__module-description">Police are looking for suspects in a smash-and-grab on Elm Street.</p>
+    </article>
+    <div class="grid__module">
+        <h3 class="grid__module-heading"><a href="/article/weather/forecast/2">Weekend forecast</a></h3>
+        <p class="grid__module-description">Sunny skies ahead.</p>
+    </div>
+</body>
+</html>
+"""
+
+@pytest.fixture(autouse=True)
+def empty_driver_pool():
+    """Keep pooled drivers from leaking between tests."""
+    WFAAScraper.shutdown_drivers()
+    yield
+    WFAAScraper.shutdown_drivers()
+
+class TestWFAAScraper:
+    """Test suite for the WFAA scraper."""
+
+    @patch.object(WFAAScraper, 'fetch_page')
+    @patch.object(WFAAScraper, 'setup_driver')
+    @patch.object(WFAAScraper, 'scroll_to_load_more')
+    def test_scrape_crime_news(self, mock_scroll, mock_setup, mock_fetch):
+        """Test that relevant posts are kept once each, even when several selectors match them."""
+        mock_fetch.return_value = SAMPLE_HTML
+        scraper = WFAAScraper()
+        scraper.driver = MagicMock()
+        scraper.driver.execute_script.return_value = SAMPLE_HTML
+
+        results = scraper.scrape_crime_news()
+
+        assert len(results["Texas"]) == 1
+        article = results["Texas"][0]
+        assert article["url"] == "https://www.wfaa.com/article/news/crime/store-robbery/1"
+        assert article["is_business_related"] is True
+        assert sum(len(articles) for articles in results.values()) == 1
+
+    @patch.object(WFAAScraper, 'fetch_page', return_value=None)
+    @patch.object(WFAAScraper, 'setup_driver')
+    def test_failed_page_not_refetched(self, mock_setup, mock_fetch):
+        """Test that a failed crime page is fetched only once and yields no articles."""
+        scraper = WFAAScraper()
+
+        results = scraper.scrape_crime_news()
+
+        mock_fetch.assert_called_once_with(scraper.config["url"])
+        assert not any(results.values())
+
+    @patch.object(WFAAScraper, 'setup_driver')
+    def test_driver_reused_across_scrapes(self, mock_setup):
+        """Test that a released driver is handed to the next scraper instead of a new one."""
+        driver = MagicMock()
+
+        first = WFAAScraper()
+        first.driver = driver
+        first._release_driver()
+
+        second = WFAAScraper()
+        assert second._acquire_driver() is driver
+        driver.quit.assert_not_called()
+        mock_setup.assert_not_called()
+
+    @patch.object(WFAAScraper, 'setup_driver')
+    def test_dirty_driver_not_pooled(self, mock_setup):
+        """Test that a driver which hit a navigation error is quit instead of pooled."""
+        driver = MagicMock()
+        driver.get.side_effect = Exception("tab crashed")
+
+        scraper = WFAAScraper()
+        scraper.driver = driver
+        with patch.object(WFAAScraper, '_fetch_with_requests', return_value=None), \
+                patch('src.scrapers.wfaa.scraper.time.sleep'):
+            scraper.fetch_page(scraper.url)
+        scraper._release_driver()
+
+        driver.quit.assert_called_once()
+        assert WFAAScraper._driver_pool.empty()
+
+    def test_find_element_skips_invalid_selector(self):
+        """Test that one invalid selector is skipped instead of breaking the whole list."""
+        soup = BeautifulSoup(SAMPLE_HTML, 'lxml')
+
+        element = WFAAScraper().find_element(soup, ["h3[", ".grid__module-description"])
+
+        assert element.get_text(strip=True).startswith("Police are looking")
+
+    def test_utility_functions(self):
+        """Test the utility functions used by the WFAA scraper."""
+        # Texas wins over any other location mentioned
+        assert detect_location("Suspects fled Las Vegas for Dallas") == "Texas"
+        assert detect_location("A Phoenix store was robbed") == "Arizona"
+        assert detect_location("No place mentioned") is None
+
+        keywords, business_related = analyze_text("Store theft reported to police")
+        assert keywords == ["theft", "store theft", "police"]
+        assert business_related is True